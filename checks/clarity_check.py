@@ -20,11 +20,9 @@ def calculate_ink_ratio(image):
     """
     start_time = time.time()
     
-    # Convert PIL image to OpenCV format
-    img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-    # Convert to grayscale for processing
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    # Convert PIL image to OpenCV grayscale ('L' images already are)
+    img_cv = np.asarray(image)
+    gray = img_cv if img_cv.ndim == 2 else cv2.cvtColor(img_cv, cv2.COLOR_RGB2GRAY)
 
     # Apply Otsu's thresholding to get binary image
     _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
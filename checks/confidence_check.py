@@ -23,6 +23,46 @@ ARTIFACT_PATTERNS = [
     re.compile(r'storyblok|wikimedia|upload\\.', re.IGNORECASE),  # Web artifacts
 ]
 
+# Tesseract config for the enhanced-image retry in balanced mode
+ENHANCED_OCR_CONFIG = '--psm 4 -c tessedit_char_whitelist=0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def _parse_ocr_boxes(ocr_data):
+    """
+    Parse the per-box text and confidence columns of `image_to_data` output.
+
+    Args:
+        ocr_data: dict returned by `pytesseract.image_to_data`
+
+    Returns:
+        tuple: (confidences, has_text) - float array with invalid and negative
+        confidences set to 0.0, and a bool array marking boxes with text
+    """
+    texts = ocr_data.get('text', [])
+    n_boxes = len(texts)
+    conf_raw = ocr_data.get('conf', [])[:n_boxes]
+
+    raw = np.asarray(conf_raw)
+    confidences = None
+    if raw.dtype.kind in 'iufU':
+        # Numbers or numeric strings convert in one C-level pass
+        try:
+            confidences = raw.astype(np.float64)
+        except ValueError:
+            pass
+    if confidences is None:
+        # Mixed or non-numeric values: parse box by box, invalid ones count as 0
+        confidences = np.empty(len(conf_raw), dtype=np.float64)
+        for i, conf in enumerate(conf_raw):
+            try:
+                confidences[i] = float(conf)
+            except (ValueError, TypeError):
+                confidences[i] = 0.0
+    confidences[confidences < 0] = 0.0
+
+    has_text = np.char.str_len(np.char.strip(np.asarray(texts, dtype=str))) > 0
+    return confidences, has_text
+
 
 def _extract_confidences_from_ocr_data(ocr_data):
     """
@@ -38,32 +78,8 @@ def _extract_confidences_from_ocr_data(ocr_data):
     Returns:
         list of float: Confidence values (0.0 - 100.0) for ALL boxes.
     """
-    confidences = []
-    n_boxes = len(ocr_data.get('text', []))
-    for i in range(n_boxes):
-        text = ocr_data.get('text', [])[i]
-        conf_raw = ocr_data.get('conf', [])[i]
-
-        # Try to parse confidence value
-        try:
-            conf_val = float(conf_raw)
-        except (ValueError, TypeError):
-            # Invalid confidence value - treat as 0
-            confidences.append(0.0)
-            continue
-
-        # Check if confidence is valid (non-negative)
-        if conf_val < 0:
-            confidences.append(0.0)
-            continue
-
-        # If box has text, use its confidence; otherwise, count as 0
-        if text and text.strip():
-            confidences.append(conf_val)
-        else:
-            confidences.append(0.0)
-
-    return confidences
+    confidences, has_text = _parse_ocr_boxes(ocr_data)
+    return np.where(has_text, confidences, 0.0).tolist()
 
 
 def _extract_confidences_weighted(ocr_data):
@@ -79,32 +95,13 @@ def _extract_confidences_weighted(ocr_data):
     Returns:
         tuple: (overall_conf, text_conf, text_box_count, total_box_count)
     """
-    all_confidences = []
-    text_confidences = []
-    n_boxes = len(ocr_data.get('text', []))
-
-    for i in range(n_boxes):
-        text = ocr_data.get('text', [])[i]
-        conf_raw = ocr_data.get('conf', [])[i]
+    confidences, has_text = _parse_ocr_boxes(ocr_data)
+    n_boxes = len(has_text)
+    text_confidences = confidences[has_text]
 
-        try:
-            conf_val = float(conf_raw)
-        except (ValueError, TypeError):
-            conf_val = 0.0
-
-        if conf_val < 0:
-            conf_val = 0.0
-
-        # Include in overall average (all boxes)
-        if text and text.strip():
-            all_confidences.append(conf_val)
-            text_confidences.append(conf_val)
-        else:
-            # Empty boxes contribute 0 to overall average
-            all_confidences.append(0.0)
-
-    overall_conf = sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
-    text_conf = sum(text_confidences) / len(text_confidences) if text_confidences else 0.0
+    # Empty boxes contribute 0 to the overall average
+    overall_conf = float(text_confidences.sum() / n_boxes) if n_boxes else 0.0
+    text_conf = float(text_confidences.mean()) if text_confidences.size else 0.0
 
     return overall_conf, text_conf, len(text_confidences), n_boxes
 
@@ -127,48 +124,30 @@ def _extract_confidences_filtered(ocr_data):
     Returns:
         tuple: (filtered_conf, total_conf, filtered_box_count, total_box_count, has_artifacts)
     """
-    all_confidences = []
-    text_confidences = []
-    filtered_confidences = []
-    n_boxes = len(ocr_data.get('text', []))
-    artifact_count = 0
-
-    for i in range(n_boxes):
-        text = ocr_data.get('text', [])[i]
-        conf_raw = ocr_data.get('conf', [])[i]
-
-        try:
-            conf_val = float(conf_raw)
-        except (ValueError, TypeError):
-            conf_val = 0.0
-
-        if conf_val < 0:
-            conf_val = 0.0
-
-        # Include in total average (all boxes with text)
-        if text and text.strip():
-            all_confidences.append(conf_val)
-            
-            # Check if this is an artifact
-            is_artifact = False
-            for pattern in ARTIFACT_PATTERNS:
-                if pattern.search(text):
-                    is_artifact = True
-                    artifact_count += 1
-                    break
-            
-            # Only include non-artifact text in filtered confidence
-            if not is_artifact:
-                filtered_confidences.append(conf_val)
-                text_confidences.append(conf_val)
-            else:
+    confidences, has_text = _parse_ocr_boxes(ocr_data)
+    n_boxes = len(has_text)
+    texts = ocr_data.get('text', [])
+
+    # Only boxes with text can be artifacts; the regexes still run per box
+    text_indices = np.flatnonzero(has_text)
+    is_content = np.ones(len(text_indices), dtype=bool)
+    for j, i in enumerate(text_indices):
+        text = texts[i]
+        for pattern in ARTIFACT_PATTERNS:
+            if pattern.search(text):
+                is_content[j] = False
                 # Log artifact for debugging
-                logger.debug(f"Filtered artifact: '{text}' (conf: {conf_val})")
+                logger.debug(f"Filtered artifact: '{text}' (conf: {confidences[i]})")
+                break
+
+    text_confidences = confidences[text_indices]
+    filtered_confidences = text_confidences[is_content]
+    artifact_count = len(text_indices) - len(filtered_confidences)
 
     # Calculate averages
-    total_conf = sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
-    filtered_conf = sum(filtered_confidences) / len(filtered_confidences) if filtered_confidences else 0.0
-    text_conf = sum(text_confidences) / len(text_confidences) if text_confidences else 0.0
+    total_conf = float(text_confidences.mean()) if text_confidences.size else 0.0
+    filtered_conf = float(filtered_confidences.mean()) if filtered_confidences.size else 0.0
+    text_conf = filtered_conf
     
     has_artifacts = artifact_count > 0
 
@@ -196,10 +175,6 @@ def calculate_ocr_confidence_fast(image, lang='eng', verbose: bool = False):
 
     # DO NOT resize - use full resolution for accurate confidence calculation
     # Resize destroys text quality for large documents
-    img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-    # Convert to grayscale for OCR
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
 
     # Single PSM mode for speed with language support
     config_str = f'--psm 6 -l {lang}'
@@ -277,12 +252,6 @@ def calculate_ocr_confidence_superfast(image, lang='eng', verbose: bool = False)
     # Resize image significantly to speed up OCR
     resized_image = resize_image_for_ocr(image, max_size=(400, 400))
 
-    # Convert PIL image to OpenCV format
-    img_cv = cv2.cvtColor(np.array(resized_image), cv2.COLOR_RGB2BGR)
-
-    # Convert to grayscale for OCR
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
     # Use the simplest PSM mode for speed with language support
     config_str = f'--psm 7 -l {lang}'
 
@@ -294,13 +263,12 @@ def calculate_ocr_confidence_superfast(image, lang='eng', verbose: bool = False)
             config=config_str
         )
 
-        # Extract numeric confidences safely
-        confidences = _extract_confidences_from_ocr_data(ocr_data)
-        avg_conf = sum(confidences) / len(confidences) if confidences else 0
+        # Average over all boxes (empty boxes count as 0)
+        avg_conf, _, _, box_count = _extract_confidences_weighted(ocr_data)
 
         if verbose or any(h.level == logging.DEBUG for h in logger.handlers):
             try:
-                logger.debug(f"SUPERFAST OCR boxes={len(ocr_data.get('text', []))}, confidences_count={len(confidences)}")
+                logger.debug(f"SUPERFAST OCR boxes={len(ocr_data.get('text', []))}, confidences_count={box_count}")
             except Exception:
                 pass
 
@@ -315,8 +283,7 @@ def calculate_ocr_confidence_superfast(image, lang='eng', verbose: bool = False)
                     output_type=pytesseract.Output.DICT,
                     config=config_str
                 )
-                confidences = _extract_confidences_from_ocr_data(ocr_data)
-                avg_conf = sum(confidences) / len(confidences) if confidences else 0
+                avg_conf = _extract_confidences_weighted(ocr_data)[0]
             except:
                 avg_conf = 0
         else:
@@ -356,13 +323,12 @@ def calculate_ocr_confidence_balanced(image, lang='eng', verbose: bool = False):
             config=config_str
         )
 
-        # Extract numeric confidences safely
-        confidences = _extract_confidences_from_ocr_data(ocr_data)
-        best_conf = sum(confidences) / len(confidences) if confidences else 0
+        # Average over all boxes (empty boxes count as 0)
+        best_conf, _, _, box_count = _extract_confidences_weighted(ocr_data)
 
         if verbose or any(h.level == logging.DEBUG for h in logger.handlers):
             try:
-                logger.debug(f"BALANCED OCR boxes={len(ocr_data.get('text', []))}, confidences_count={len(confidences)}")
+                logger.debug(f"BALANCED OCR boxes={len(ocr_data.get('text', []))}, confidences_count={box_count}")
             except Exception:
                 pass
 
@@ -374,19 +340,18 @@ def calculate_ocr_confidence_balanced(image, lang='eng', verbose: bool = False):
     except Exception:
         best_conf = 0
 
-    # Convert PIL to OpenCV for enhancement
-    img_cv = cv2.cvtColor(np.array(resized_image), cv2.COLOR_RGB2BGR)
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
     # If confidence is low, try enhancement and one more PSM mode
     if best_conf < 10:
+        # Convert PIL to OpenCV grayscale for enhancement ('L' images already are)
+        img_cv = np.asarray(resized_image)
+        gray = img_cv if img_cv.ndim == 2 else cv2.cvtColor(img_cv, cv2.COLOR_RGB2GRAY)
+
         # Enhance image for better OCR
         blurred = cv2.GaussianBlur(gray, (1, 1), 0)
         enhanced = cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
 
         # Try one more PSM mode only if needed
-        psm_mode = '--psm 4'
-        config_str = psm_mode + ' -c tessedit_char_whitelist=0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        config_str = ENHANCED_OCR_CONFIG
 
         try:
             # Convert enhanced (numpy) image back to PIL for pytesseract
@@ -404,8 +369,7 @@ def calculate_ocr_confidence_balanced(image, lang='eng', verbose: bool = False):
                 config=config_str
             )
 
-            enhanced_confidences = _extract_confidences_from_ocr_data(enhanced_ocr_data)
-            enhanced_avg_conf = sum(enhanced_confidences) / len(enhanced_confidences) if enhanced_confidences else 0
+            enhanced_avg_conf = _extract_confidences_weighted(enhanced_ocr_data)[0]
 
             # Update best confidence if this is better
             if enhanced_avg_conf > best_conf:
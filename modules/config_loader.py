@@ -2,25 +2,43 @@
 Configuration loader for identity card detection settings.
 """
 
-import json
+import mmap
 import os
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, NamedTuple
 
+import orjson
 
-class Config:
-    """Configuration manager for identity card detection."""
+
+# Marks a dotted key that does not resolve (None is a valid config value)
+_MISSING = object()
+
+
+class _ConfigState(NamedTuple):
+    """
+    Everything derived from one load of the config file.
     
-    _instance = None
-    _config_data = None
+    Built completely before it is published with a single attribute
+    assignment, so a reader running during a reload sees either the old
+    state or the new one, never a mix of both.
+    """
+    data: Dict[str, Any]
+    doc_type_cache: Dict[str, Dict]
+    doc_side_cache: Dict[str, Dict]
+    enabled_doc_types: Dict[str, Dict]
+    enabled_doc_sides: Dict[str, Dict]
+    # Dotted-key lookups resolved against this state's data
+    path_cache: Dict[str, Any]
+
+
+class Config:
+    """
+    Configuration manager for identity card detection.
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    Use get_config() for the shared module-level instance.
+    """
     
     def __init__(self):
-        if self._config_data is None:
-            self.load_config()
+        self.load_config()
     
     def load_config(self, config_path: str = None):
         """
@@ -41,26 +59,85 @@ class Config:
             )
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self._config_data = json.load(f)
+            # Parse straight from a read-only memory map; orjson takes a
+            # memoryview so the file is never copied into a bytes object.
+            with open(config_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        config_data = orjson.loads(view)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found at: {config_path}\n"
                 f"Please create config.json with required document types and settings."
             )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
+        except ValueError as e:
+            # mmap refuses zero-length files
+            raise ValueError(f"Invalid JSON in config file: {e}")
+
+        self._state = self._build_state(config_data)
+    
+    @staticmethod
+    def _build_state(config_data: Dict[str, Any]) -> _ConfigState:
+        """
+        Flatten per-type and per-side settings so each accessor is a single
+        dict lookup instead of a walk through the raw config.
+        
+        Args:
+            config_data: Parsed config file
+            
+        Returns:
+            _ConfigState ready to be published
+        """
+        doc_types = config_data.get('document_types', {})
+        doc_sides = config_data.get('document_sides', {})
+        
+        doc_type_cache = {}
+        for doc_type, data in doc_types.items():
+            color = data.get('color', [128, 128, 128])
+            doc_type_cache[doc_type] = {
+                'label': data.get('label', doc_type.upper()),
+                'name': data.get('display_name', data.get('name', doc_type)),
+                'color': tuple(color) if isinstance(color, list) else (128, 128, 128),
+                'keywords': data.get('keywords', {}),
+                'aliases': data.get('aliases', []),
+                'enabled': data.get('enabled', True)
+            }
+        
+        doc_side_cache = {}
+        for side, data in doc_sides.items():
+            doc_side_cache[side] = {
+                'label': data.get('label', side[0].upper()),
+                'name': data.get('display_name', data.get('name', side)),
+                'short_code': data.get('short_code', side[0].upper()),
+                'keywords': data.get('keywords', {}),
+                'aliases': data.get('aliases', []),
+                'enabled': data.get('enabled', True)
+            }
+        
+        return _ConfigState(
+            data=config_data,
+            doc_type_cache=doc_type_cache,
+            doc_side_cache=doc_side_cache,
+            enabled_doc_types={
+                key: data for key, data in doc_types.items()
+                if doc_type_cache[key]['enabled']
+            },
+            enabled_doc_sides={
+                key: data for key, data in doc_sides.items()
+                if doc_side_cache[key]['enabled']
+            },
+            path_cache={}
+        )
     
     def get_document_types(self) -> Dict[str, Dict]:
         """Get all configured document types."""
-        return self._config_data.get('document_types', {})
+        return self._state.data.get('document_types', {})
     
     def get_enabled_document_types(self) -> Dict[str, Dict]:
         """Get only enabled document types."""
-        return {
-            key: data for key, data in self.get_document_types().items()
-            if data.get('enabled', True)
-        }
+        return self._state.enabled_doc_types
     
     def get_document_type_config(self, doc_type: str) -> Dict:
         """
@@ -85,8 +162,8 @@ class Config:
         Returns:
             Unique label string
         """
-        config = self.get_document_type_config(doc_type)
-        return config.get('label', doc_type.upper())
+        entry = self._state.doc_type_cache.get(doc_type)
+        return entry['label'] if entry else doc_type.upper()
     
     def get_document_type_name(self, doc_type: str) -> str:
         """
@@ -98,8 +175,8 @@ class Config:
         Returns:
             Display name (falls back to key if not found)
         """
-        config = self.get_document_type_config(doc_type)
-        return config.get('display_name', config.get('name', doc_type))
+        entry = self._state.doc_type_cache.get(doc_type)
+        return entry['name'] if entry else doc_type
     
     def get_document_type_color(self, doc_type: str) -> Tuple[int, int, int]:
         """
@@ -111,9 +188,8 @@ class Config:
         Returns:
             RGB color tuple
         """
-        config = self.get_document_type_config(doc_type)
-        color = config.get('color', [128, 128, 128])
-        return tuple(color) if isinstance(color, list) else (128, 128, 128)
+        entry = self._state.doc_type_cache.get(doc_type)
+        return entry['color'] if entry else (128, 128, 128)
     
     def get_document_type_keywords(self, doc_type: str) -> Dict[str, List[str]]:
         """
@@ -125,8 +201,8 @@ class Config:
         Returns:
             Dictionary of language to keywords mapping
         """
-        config = self.get_document_type_config(doc_type)
-        return config.get('keywords', {})
+        entry = self._state.doc_type_cache.get(doc_type)
+        return entry['keywords'] if entry else {}
     
     def get_document_type_aliases(self, doc_type: str) -> List[str]:
         """
@@ -138,8 +214,8 @@ class Config:
         Returns:
             List of aliases
         """
-        config = self.get_document_type_config(doc_type)
-        return config.get('aliases', [])
+        entry = self._state.doc_type_cache.get(doc_type)
+        return entry['aliases'] if entry else []
     
     def get_all_document_type_keywords(self) -> Dict[str, Dict[str, List[str]]]:
         """Get keywords for all document types."""
@@ -150,14 +226,11 @@ class Config:
     
     def get_document_sides(self) -> Dict[str, Dict]:
         """Get all configured document sides."""
-        return self._config_data.get('document_sides', {})
+        return self._state.data.get('document_sides', {})
     
     def get_enabled_document_sides(self) -> Dict[str, Dict]:
         """Get only enabled document sides."""
-        return {
-            key: data for key, data in self.get_document_sides().items()
-            if data.get('enabled', True)
-        }
+        return self._state.enabled_doc_sides
     
     def get_document_side_config(self, side: str) -> Dict:
         """
@@ -182,8 +255,8 @@ class Config:
         Returns:
             Unique label string
         """
-        config = self.get_document_side_config(side)
-        return config.get('label', side[0].upper())
+        entry = self._state.doc_side_cache.get(side)
+        return entry['label'] if entry else side[0].upper()
     
     def get_document_side_name(self, side: str) -> str:
         """
@@ -195,8 +268,8 @@ class Config:
         Returns:
             Display name
         """
-        config = self.get_document_side_config(side)
-        return config.get('display_name', config.get('name', side))
+        entry = self._state.doc_side_cache.get(side)
+        return entry['name'] if entry else side
     
     def get_document_side_short_code(self, side: str) -> str:
         """
@@ -208,8 +281,8 @@ class Config:
         Returns:
             Short code
         """
-        config = self.get_document_side_config(side)
-        return config.get('short_code', side[0].upper())
+        entry = self._state.doc_side_cache.get(side)
+        return entry['short_code'] if entry else side[0].upper()
     
     def get_document_side_keywords(self, side: str) -> Dict[str, List[str]]:
         """
@@ -221,8 +294,8 @@ class Config:
         Returns:
             Dictionary of language to keywords mapping
         """
-        config = self.get_document_side_config(side)
-        return config.get('keywords', {})
+        entry = self._state.doc_side_cache.get(side)
+        return entry['keywords'] if entry else {}
     
     def get_all_document_side_keywords(self) -> Dict[str, Dict[str, List[str]]]:
         """Get keywords for all document sides."""
@@ -241,8 +314,8 @@ class Config:
         Returns:
             List of aliases
         """
-        config = self.get_document_side_config(side)
-        return config.get('aliases', [])
+        entry = self._state.doc_side_cache.get(side)
+        return entry['aliases'] if entry else []
     
     def get(self, key: str, default: any = None) -> any:
         """
@@ -255,20 +328,42 @@ class Config:
         Returns:
             Config value
         """
-        keys = key.split('.')
-        value = self._config_data
+        # One read of the state, so the cache and the data always match
+        state = self._state
+        try:
+            value = state.path_cache[key]
+        except KeyError:
+            value = state.path_cache[key] = self._resolve_path(state.data, key)
+        return default if value is _MISSING else value
+    
+    @staticmethod
+    def _resolve_path(config_data: Dict[str, Any], key: str) -> Any:
+        """
+        Walk a dotted key through the config data.
+        
+        Results are cached per key in the state's path_cache, which starts
+        empty whenever the config is (re)loaded.
+        
+        Args:
+            config_data: Config data to walk
+            key: Dot-separated config key
+            
+        Returns:
+            Resolved value, or _MISSING if any segment is absent
+        """
+        value = config_data
         
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         
         return value
     
     def get_detection_settings(self) -> Dict[str, float]:
         """Get detection settings."""
-        return self._config_data.get('detection_settings', {})
+        return self._state.data.get('detection_settings', {})
     
     def get_setting(self, key: str, default: float = None) -> float:
         """
@@ -286,7 +381,6 @@ class Config:
     
     def reload_config(self, config_path: str = None):
         """Reload configuration from file."""
-        self._config_data = None
         self.load_config(config_path)
     
     def get_all_keywords_flat(self) -> Dict[str, List[str]]:
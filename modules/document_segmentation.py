@@ -2,6 +2,8 @@
 Document segmentation module for handling multiple documents on a single page.
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 from PIL import Image
@@ -9,6 +11,13 @@ from typing import List, Tuple, Dict
 from dataclasses import dataclass
 
 
+# Shared rectangular kernels for morphological close/dilate. OpenCV already
+# applies rectangular kernels as separate row and column passes.
+_KERNEL5x5 = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+# Two 5x5 dilations equal one 9x9 dilation
+_KERNEL9x9 = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9))
+
+
 @dataclass
 class DocumentSegment:
     """Data class for a segmented document with bounding box."""
@@ -41,41 +50,54 @@ def segment_documents_on_page(image: Image.Image, config: Dict = None) -> List[D
     max_aspect_ratio = config.get('max_aspect_ratio', 2.0)
     padding_percent = config.get('padding_percent', 5.0) / 100
     
-    # Convert PIL to OpenCV
-    img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-    img_height, img_width = img_cv.shape[:2]
-    total_area = img_width * img_height
+    # Work on an RGB view of the page: gray for detection, RGB slices for crops
+    img_rgb = np.asarray(image if image.mode == 'RGB' else image.convert('RGB'))
+    gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
+    img_height, img_width = img_rgb.shape[:2]
+    total_area = img_height * img_width
     
     # Apply threshold to get binary image
-    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    otsu_thresh, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
     
     # Morphological operations to connect nearby regions
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-    thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+    thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, _KERNEL5x5)
     
-    # Find contours (potential document boundaries)
+    # Find contours (potential document boundaries). Contours rather than
+    # connectedComponentsWithStats: the area filter needs the filled outline
+    # area, while component stats only count the (mostly hollow) ink pixels.
     contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     
     # Filter contours to find document-sized rectangles
     document_contours = []
     
-    for contour in contours:
-        x, y, w, h = cv2.boundingRect(contour)
-        area = cv2.contourArea(contour)
-        
-        # Calculate area percentage
-        area_percent = area / total_area
-        
-        # Calculate aspect ratio
-        aspect_ratio = w / h if h > 0 else 0
+    # Document size criteria (loop-invariant)
+    min_area = total_area * min_area_percent
+    max_area = total_area * max_area_percent
+    
+    if contours:
+        # Bounding rects of all contours in one NumPy pass over the concatenated
+        # points (same values as cv2.boundingRect, without a C call per contour)
+        points = np.concatenate(contours).reshape(-1, 2)
+        lengths = np.fromiter((len(c) for c in contours), dtype=np.intp, count=len(contours))
+        starts = np.concatenate(([0], np.cumsum(lengths[:-1])))
+        top_left = np.minimum.reduceat(points, starts)
+        sizes = np.maximum.reduceat(points, starts) - top_left + 1
+        widths, heights = sizes[:, 0], sizes[:, 1]
         
-        # Check if contour matches document size criteria
-        min_area = total_area * min_area_percent
-        max_area = total_area * max_area_percent
+        # A contour never covers more than its bounding box, so most noise
+        # contours can be rejected before computing the exact area
+        candidates = np.flatnonzero(
+            (widths * heights > min_area) &
+            # Aspect ratio test cross-multiplied (heights are always >= 1)
+            (min_aspect_ratio * heights < widths) & (widths < max_aspect_ratio * heights)
+        )
         
-        if min_area < area < max_area and min_aspect_ratio < aspect_ratio < max_aspect_ratio:
-            document_contours.append((x, y, w, h))
+        for idx in candidates:
+            area = cv2.contourArea(contours[idx])
+            if min_area < area < max_area:
+                x, y = top_left[idx].tolist()
+                w, h = sizes[idx].tolist()
+                document_contours.append((x, y, w, h))
     
     # Sort contours by x-coordinate to process left to right
     document_contours.sort(key=lambda c: c[0])
@@ -96,10 +118,7 @@ def segment_documents_on_page(image: Image.Image, config: Dict = None) -> List[D
         y_end = min(img_height, y + h + pad_y)
         
         # Extract the document region
-        doc_region = img_cv[y_start:y_end, x_start:x_end]
-        
-        # Convert back to PIL
-        doc_pil = Image.fromarray(cv2.cvtColor(doc_region, cv2.COLOR_BGR2RGB))
+        doc_pil = Image.fromarray(img_rgb[y_start:y_end, x_start:x_end])
         
         # Create DocumentSegment with bounding box (relative to original image)
         segment = DocumentSegment(
@@ -111,24 +130,27 @@ def segment_documents_on_page(image: Image.Image, config: Dict = None) -> List[D
     
     # Fix overlapping segments - adjust bounding boxes to eliminate overlaps
     if len(segmented_docs) > 1:
-        segmented_docs = _fix_overlapping_bboxes(segmented_docs, img_cv)
+        segmented_docs = _fix_overlapping_bboxes(segmented_docs, img_rgb)
     
     # If no documents were found using contours, return the whole page
     if not segmented_docs:
         # Try projection-based splitting first (better for clean front/back pairs)
+        # Both splitters share one binarized image (reusing the page's Otsu threshold)
+        bw = _binarize_for_projection(gray, otsu_thresh)
+
         # Try horizontal projection split (double document stacked top/bottom)
-        horiz_segments = _segment_by_horizontal_projection(gray, img_width, img_height, padding_percent)
+        horiz_segments = _segment_by_horizontal_projection(gray, bw, img_width, img_height)
         if horiz_segments:
             return horiz_segments
 
         # Try vertical projection split (documents placed side-by-side)
-        vert_segments = _segment_by_vertical_projection(gray, img_width, img_height, padding_percent)
+        vert_segments = _segment_by_vertical_projection(gray, bw, img_width, img_height)
         if vert_segments:
             return vert_segments
 
         # Try an edge-detection based segmentation fallback
-        edge_segments = _segment_with_edge_detection(img_cv, img_width, img_height,
-                                                     min_area, max_area,
+        edge_segments = _segment_with_edge_detection(img_rgb, gray, img_width, img_height,
+                                                     min_area_percent, max_area_percent,
                                                      min_aspect_ratio, max_aspect_ratio,
                                                      padding_percent)
         if edge_segments:
@@ -140,6 +162,53 @@ def segment_documents_on_page(image: Image.Image, config: Dict = None) -> List[D
     return segmented_docs
 
 
+def _select_non_overlapping(boxes, order, iou_threshold):
+    """
+    Scalar-loop version of the greedy selection in remove_overlapping_contours,
+    written so numba can compile it without building N x N matrices.
+    
+    Args:
+        boxes: (N, 4) int64 array of (x, y, w, h)
+        order: Indices of boxes, largest area first
+        iou_threshold: IoU threshold for considering contours as overlapping
+        
+    Returns:
+        Array of kept indices in selection order
+    """
+    kept = np.empty(boxes.shape[0], dtype=np.int64)
+    n_kept = 0
+    for i in order:
+        x1, y1, w1, h1 = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+        overlaps = False
+        for k in range(n_kept):
+            j = kept[k]
+            x2, y2, w2, h2 = boxes[j, 0], boxes[j, 1], boxes[j, 2], boxes[j, 3]
+            inter_w = max(0, min(x1 + w1, x2 + w2) - max(x1, x2))
+            inter_h = max(0, min(y1 + h1, y2 + h2) - max(y1, y2))
+            inter_area = inter_w * inter_h
+            union_area = w1 * h1 + w2 * h2 - inter_area
+            iou = inter_area / union_area if union_area > 0 else 0.0
+            no_gap = (x1 + w1 >= x2 and x2 + w2 >= x1 and
+                      y1 + h1 >= y2 and y2 + h2 >= y1)
+            if iou > iou_threshold or no_gap:
+                overlaps = True
+                break
+        if not overlaps:
+            kept[n_kept] = i
+            n_kept += 1
+    return kept[:n_kept]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_jit_selector():
+    """Compile _select_non_overlapping with numba if it is installed, else return None."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_select_non_overlapping)
+
+
 def remove_overlapping_contours(contours: List[Tuple[int, int, int, int]], 
                                 iou_threshold: float = 0.3) -> List[Tuple[int, int, int, int]]:
     """
@@ -156,86 +225,50 @@ def remove_overlapping_contours(contours: List[Tuple[int, int, int, int]],
     if len(contours) <= 1:
         return contours
     
-    def calculate_iou(c1, c2):
-        """Calculate IoU between two contours."""
-        x1, y1, w1, h1 = c1
-        x2, y2, w2, h2 = c2
-        
-        # Calculate intersection
-        xi1 = max(x1, x2)
-        yi1 = max(y1, y2)
-        xi2 = min(x1 + w1, x2 + w2)
-        yi2 = min(y1 + h1, y2 + h2)
-        
-        inter_area = max(0, xi2 - xi1) * max(0, yi2 - yi1)
-        
-        # Calculate union
-        area1 = w1 * h1
-        area2 = w2 * h2
-        union_area = area1 + area2 - inter_area
-        
-        # Calculate IoU
-        return inter_area / union_area if union_area > 0 else 0
+    boxes = np.asarray(contours, dtype=np.int64)
     
-    def get_separation(c1, c2):
-        """Calculate minimum separation between two contours (vertical or horizontal gap)."""
-        x1, y1, w1, h1 = c1
-        x2, y2, w2, h2 = c2
-        
-        # Get bounds
-        c1_right = x1 + w1
-        c1_bottom = y1 + h1
-        c2_right = x2 + w2
-        c2_bottom = y2 + h2
-        
-        # Calculate horizontal separation (gap between left/right)
-        if c1_right < x2:
-            h_sep = x2 - c1_right
-        elif c2_right < x1:
-            h_sep = x1 - c2_right
-        else:
-            h_sep = 0  # Overlapping horizontally
-        
-        # Calculate vertical separation (gap between top/bottom)
-        if c1_bottom < y2:
-            v_sep = y2 - c1_bottom
-        elif c2_bottom < y1:
-            v_sep = y1 - c2_bottom
-        else:
-            v_sep = 0  # Overlapping vertically
-        
-        return h_sep, v_sep
+    # Compiled scalar loop when numba is available; no N x N temporaries
+    selector = _get_jit_selector()
+    if selector is not None:
+        order = np.argsort(-(boxes[:, 2] * boxes[:, 3]), kind='stable')
+        return [contours[idx] for idx in selector(boxes, order, float(iou_threshold))]
     
-    # Sort by area (largest first)
-    sorted_contours = sorted(contours, key=lambda c: c[2] * c[3], reverse=True)
+    x, y, w, h = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    right = x + w
+    bottom = y + h
+    area = w * h
     
-    result = []
-    for contour in sorted_contours:
-        # Check if this contour overlaps with any already selected contour
-        is_overlapping = False
-        for selected in result:
-            iou = calculate_iou(contour, selected)
-            h_sep, v_sep = get_separation(contour, selected)
-            
-            # If IoU is above threshold OR they're physically overlapping (no gap), mark as overlapping
-            if iou > iou_threshold or (h_sep == 0 and v_sep == 0):
-                is_overlapping = True
-                break
-        
-        if not is_overlapping:
-            result.append(contour)
+    # Pairwise intersection / union for every contour pair in one pass
+    inter_w = np.clip(np.minimum(right[:, None], right[None, :]) - np.maximum(x[:, None], x[None, :]), 0, None)
+    inter_h = np.clip(np.minimum(bottom[:, None], bottom[None, :]) - np.maximum(y[:, None], y[None, :]), 0, None)
+    inter_area = inter_w * inter_h
+    union_area = area[:, None] + area[None, :] - inter_area
+    iou = np.divide(inter_area, union_area, out=np.zeros(union_area.shape), where=union_area > 0)
     
-    return result
+    # No horizontal AND no vertical gap means the contours touch or overlap in space
+    no_h_gap = (right[:, None] >= x[None, :]) & (right[None, :] >= x[:, None])
+    no_v_gap = (bottom[:, None] >= y[None, :]) & (bottom[None, :] >= y[:, None])
+    
+    # If IoU is above threshold OR they're physically overlapping (no gap), mark as overlapping
+    conflicts = (iou > iou_threshold) | (no_h_gap & no_v_gap)
+    
+    # Greedily keep the largest contours first (stable, like sorted(..., reverse=True))
+    kept = []
+    for idx in np.argsort(-area, kind='stable'):
+        if not conflicts[idx, kept].any():
+            kept.append(idx)
+    
+    return [contours[idx] for idx in kept]
 
 
-def _fix_overlapping_bboxes(segments: List[DocumentSegment], img_cv) -> List[DocumentSegment]:
+def _fix_overlapping_bboxes(segments: List[DocumentSegment], img_rgb) -> List[DocumentSegment]:
     """
     Fix overlapping document segments by adjusting their bounding boxes and re-extracting.
     When two segments overlap, the overlap region is assigned to the segment that comes first.
     
     Args:
         segments: List of DocumentSegment objects (assumed to be sorted top-to-bottom)
-        img_cv: Original image in OpenCV format
+        img_rgb: Original image as an RGB NumPy array
         
     Returns:
         List of DocumentSegment objects with non-overlapping bounding boxes
@@ -246,36 +279,34 @@ def _fix_overlapping_bboxes(segments: List[DocumentSegment], img_cv) -> List[Doc
     # Sort by Y coordinate (top to bottom)
     sorted_segments = sorted(segments, key=lambda s: s.bbox[1])
     
-    adjusted_bboxes = [list(s.bbox) for s in sorted_segments]
+    # Nothing to adjust if every segment ends above the next one starts; the
+    # existing crops are already clamped, so only the size filter applies
+    if all(curr.bbox[1] + curr.bbox[3] <= nxt.bbox[1]
+           for curr, nxt in zip(sorted_segments, sorted_segments[1:])):
+        return [s for s in sorted_segments if s.bbox[2] > 20 and s.bbox[3] > 20]
     
-    # Fix overlaps by adjusting Y coordinates
-    for i in range(len(adjusted_bboxes) - 1):
-        curr_x, curr_y, curr_w, curr_h = adjusted_bboxes[i]
-        next_x, next_y, next_w, next_h = adjusted_bboxes[i + 1]
-        
-        curr_bottom = curr_y + curr_h
-        
-        # If current segment's bottom overlaps with next segment's top
-        if curr_bottom > next_y:
-            # Calculate the overlap
-            overlap = curr_bottom - next_y
-            
-            # Adjust by moving the split point to the middle of the overlap
-            # Current segment loses the bottom part of the overlap
-            split_point = curr_y + (curr_h - overlap // 2)
-            
-            # Adjust current segment (make it shorter)
-            adjusted_bboxes[i][3] = split_point - curr_y
-            
-            # Adjust next segment (make it start lower and shorter)
-            adjusted_bboxes[i + 1][1] = split_point
-            adjusted_bboxes[i + 1][3] = next_y + next_h - split_point
+    bboxes = np.array([s.bbox for s in sorted_segments], dtype=np.int64)
+    tops = bboxes[:, 1].copy()
+    bottoms = bboxes[:, 1] + bboxes[:, 3]
+    
+    # Fix overlaps by adjusting Y coordinates. Splitting a pair never moves the
+    # lower segment's bottom edge, so every split point depends only on the
+    # original boxes and all pairs can be resolved at once.
+    overlaps = bottoms[:-1] - tops[1:]
+    overlapping = overlaps > 0
+    # Move the split point to the middle of the overlap
+    split_points = (bottoms[:-1] - overlaps // 2)[overlapping]
+    # Current segment loses the bottom part of the overlap, next one starts lower
+    bottoms[:-1][overlapping] = split_points
+    tops[1:][overlapping] = split_points
+    bboxes[:, 1] = tops
+    bboxes[:, 3] = bottoms - tops
     
     # Re-extract segments with adjusted bounding boxes
-    img_height, img_width = img_cv.shape[:2]
+    img_height, img_width = img_rgb.shape[:2]
     result = []
     
-    for i, (bbox, orig_segment) in enumerate(zip(adjusted_bboxes, sorted_segments)):
+    for bbox, orig_segment in zip(bboxes.tolist(), sorted_segments):
         x, y, w, h = bbox
         
         # Ensure dimensions are valid
@@ -287,8 +318,7 @@ def _fix_overlapping_bboxes(segments: List[DocumentSegment], img_cv) -> List[Doc
             y_end = min(y + h, img_height)
             
             # Re-extract from original image
-            doc_region = img_cv[y:y_end, x:x_end]
-            doc_pil = Image.fromarray(cv2.cvtColor(doc_region, cv2.COLOR_BGR2RGB))
+            doc_pil = Image.fromarray(img_rgb[y:y_end, x:x_end])
             
             adjusted_segment = DocumentSegment(
                 image=doc_pil,
@@ -316,6 +346,11 @@ def _remove_overlapping_segments(segments: List[DocumentSegment]) -> List[Docume
     # Sort segments by position (top-to-bottom, left-to-right)
     segments = sorted(segments, key=lambda s: (s.bbox[1], s.bbox[0]))
     
+    # Vertically disjoint segments cannot overlap at all
+    if all(curr.bbox[1] + curr.bbox[3] <= nxt.bbox[1]
+           for curr, nxt in zip(segments, segments[1:])):
+        return segments
+    
     result = []
     for current in segments:
         x_c, y_c, w_c, h_c = current.bbox
@@ -349,21 +384,20 @@ def _remove_overlapping_segments(segments: List[DocumentSegment]) -> List[Docume
 
 
 
-def _segment_with_edge_detection(img_cv, img_width, img_height,
-                                  min_area, max_area,
+def _segment_with_edge_detection(img_rgb, gray, img_width, img_height,
+                                  min_area_percent, max_area_percent,
                                   min_aspect_ratio, max_aspect_ratio,
                                   padding_percent) -> List[DocumentSegment]:
     """
     Try segmentation using Canny edges + contour approximation to find rectangular documents.
+    Area limits are fractions of the page area.
     """
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
     # Smooth and detect edges
     blurred = cv2.GaussianBlur(gray, (5, 5), 0)
     edges = cv2.Canny(blurred, 50, 150)
 
-    # Dilate edges to close gaps
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-    dilated = cv2.dilate(edges, kernel, iterations=2)
+    # Dilate edges to close gaps (single pass, same as 5x5 with iterations=2)
+    dilated = cv2.dilate(edges, _KERNEL9x9)
 
     contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
@@ -371,7 +405,7 @@ def _segment_with_edge_detection(img_cv, img_width, img_height,
     total_area = img_width * img_height
     for cnt in contours:
         area = cv2.contourArea(cnt)
-        if area < total_area * min_area or area > total_area * max_area:
+        if area < total_area * min_area_percent or area > total_area * max_area_percent:
             continue
 
         # Approximate polygon and look for quadrilaterals
@@ -393,8 +427,7 @@ def _segment_with_edge_detection(img_cv, img_width, img_height,
         x_end = min(img_width, x + w + pad_x)
         y_end = min(img_height, y + h + pad_y)
 
-        doc_region = img_cv[y_start:y_end, x_start:x_end]
-        doc_pil = Image.fromarray(cv2.cvtColor(doc_region, cv2.COLOR_BGR2RGB))
+        doc_pil = Image.fromarray(img_rgb[y_start:y_end, x_start:x_end])
         segments.append(DocumentSegment(image=doc_pil, bbox=(x_start, y_start, x_end-x_start, y_end-y_start), confidence=0.9))
 
     # Sort left-to-right
@@ -402,39 +435,68 @@ def _segment_with_edge_detection(img_cv, img_width, img_height,
     return segments
 
 
-def _segment_by_horizontal_projection(gray, img_width, img_height, padding_percent) -> List[DocumentSegment]:
+def _binarize_for_projection(gray, otsu_thresh: float = None):
     """
-    Split image horizontally by finding a strong horizontal valley in the projection profile.
-    Useful for pages with two documents stacked vertically (front/back).
+    Otsu-binarize a grayscale page for the projection splitters.
+    Returns a 0/255 image where content is white (255) on a black background.
+
+    If the page's Otsu threshold is already known it is reused instead of
+    running Otsu again.
     """
-    # Compute binary projection (sum of dark pixels per row)
-    _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if otsu_thresh is None:
+        _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    else:
+        _, bw = cv2.threshold(gray, otsu_thresh, 255, cv2.THRESH_BINARY)
     # In bw, text is white(255) on black(0) typically; invert if needed
-    if np.mean(bw) > 127:
+    if cv2.mean(bw)[0] > 127:
         bw = cv2.bitwise_not(bw)
+    return bw
 
-    row_sums = np.sum(bw == 255, axis=1)
+
+def _find_largest_gap(low_mask):
+    """
+    Find the longest run of True values in a 1-D projection mask.
+
+    Returns:
+        (start, end) of the first longest run with end exclusive, or None if
+        the mask has no True values
+    """
+    # +1 marks where a run starts, -1 where it ends
+    edges = np.diff(np.concatenate(([0], low_mask.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    if starts.size == 0:
+        return None
+    ends = np.flatnonzero(edges == -1)
+    longest = int(np.argmax(ends - starts))
+    return int(starts[longest]), int(ends[longest])
+
+
+def _segment_by_horizontal_projection(gray, bw, img_width, img_height) -> List[DocumentSegment]:
+    """
+    Split image horizontally by finding a strong horizontal valley in the projection profile.
+    Useful for pages with two documents stacked vertically (front/back).
+    """
+    # Compute binary projection (count of ink pixels per row; bw is 0/255)
+    row_sums = cv2.reduce(bw, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
     max_row = row_sums.max() if row_sums.size else 0
     if max_row == 0:
         return []
 
     # Find low regions where row_sums drop below a small fraction of max (gap between docs)
+    # and take the largest continuous one
     threshold = max(5, int(0.05 * max_row))
-    low_rows = np.where(row_sums < threshold)[0]
-    if low_rows.size == 0:
+    gap = _find_largest_gap(row_sums < threshold)
+    if gap is None:
         return []
-
-    # Find the largest continuous low region
-    gaps = np.split(low_rows, np.where(np.diff(low_rows) != 1)[0]+1)
-    largest_gap = max(gaps, key=lambda g: g.size)
-    gap_height = largest_gap.size
+    gap_start, gap_end = gap
+    gap_height = gap_end - gap_start
 
     # Require gap to be reasonably large (e.g., >= 3% of image height)
     if gap_height < max(3, int(0.03 * img_height)):
         return []
 
     # Choose split row as the middle of the largest gap
-    split_row = int(largest_gap.mean())
+    split_row = (gap_start + gap_end - 1) // 2
 
     # Create two segments: top and bottom
     pad_y = int(0.01 * img_height)
@@ -448,47 +510,39 @@ def _segment_by_horizontal_projection(gray, img_width, img_height, padding_perce
         if y1 - y0 <= 10:
             continue
         doc_region = gray[y0:y1, :]
-        # Convert to RGB for PIL
-        doc_rgb = cv2.cvtColor(cv2.merge([doc_region, doc_region, doc_region]), cv2.COLOR_BGR2RGB)
-        doc_pil = Image.fromarray(doc_rgb)
+        # Keep the segment grayscale ('L'); OCR and ink checks accept it
+        doc_pil = Image.fromarray(doc_region)
         segments.append(DocumentSegment(image=doc_pil, bbox=(0, y0, img_width, y1-y0), confidence=0.6))
 
     return segments
 
 
-def _segment_by_vertical_projection(gray, img_width, img_height, padding_percent) -> List[DocumentSegment]:
+def _segment_by_vertical_projection(gray, bw, img_width, img_height) -> List[DocumentSegment]:
     """
     Split image vertically by finding a strong vertical valley in the projection profile.
     Useful for pages with two documents placed side-by-side (left/right).
     """
-    # Compute binary projection (sum of dark pixels per column)
-    _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    # In bw, text is white(255) on black(0) typically; invert if needed
-    if np.mean(bw) > 127:
-        bw = cv2.bitwise_not(bw)
-
-    col_sums = np.sum(bw == 255, axis=0)
+    # Compute binary projection (count of ink pixels per column; bw is 0/255)
+    col_sums = cv2.reduce(bw, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
     max_col = col_sums.max() if col_sums.size else 0
     if max_col == 0:
         return []
 
     # Find low regions where col_sums drop below a small fraction of max (gap between docs)
+    # and take the largest continuous one
     threshold = max(5, int(0.05 * max_col))
-    low_cols = np.where(col_sums < threshold)[0]
-    if low_cols.size == 0:
+    gap = _find_largest_gap(col_sums < threshold)
+    if gap is None:
         return []
-
-    # Find the largest continuous low region
-    gaps = np.split(low_cols, np.where(np.diff(low_cols) != 1)[0]+1)
-    largest_gap = max(gaps, key=lambda g: g.size)
-    gap_width = largest_gap.size
+    gap_start, gap_end = gap
+    gap_width = gap_end - gap_start
 
     # Require gap to be reasonably large (e.g., >= 3% of image width)
     if gap_width < max(3, int(0.03 * img_width)):
         return []
 
     # Choose split column as the middle of the largest gap
-    split_col = int(largest_gap.mean())
+    split_col = (gap_start + gap_end - 1) // 2
 
     # Create two segments: left and right
     pad_x = int(0.01 * img_width)
@@ -502,66 +556,94 @@ def _segment_by_vertical_projection(gray, img_width, img_height, padding_percent
         if x1 - x0 <= 10:
             continue
         doc_region = gray[:, x0:x1]
-        # Convert to RGB for PIL
-        doc_rgb = cv2.cvtColor(cv2.merge([doc_region, doc_region, doc_region]), cv2.COLOR_BGR2RGB)
-        doc_pil = Image.fromarray(doc_rgb)
+        # Keep the segment grayscale ('L'); OCR and ink checks accept it
+        doc_pil = Image.fromarray(doc_region)
         segments.append(DocumentSegment(image=doc_pil, bbox=(x0, 0, x1-x0, img_height), confidence=0.6))
 
     return segments
 
 
 
-def process_page_with_multiple_documents(image: Image.Image, text_content: str, page_number: int) -> List['IdentityCardClassification']:
+@functools.lru_cache(maxsize=1)
+def _get_detector():
+    """Return a detector shared across segments and pages (it only holds the global config)."""
+    # Import locally to avoid circular dependency
+    from modules.identity_detection import IdentityCardDetector
+    return IdentityCardDetector()
+
+
+def _process_segment(detector, page_number, idx: int, segment: DocumentSegment) -> 'IdentityCardClassification':
     """
-    Process a page that may contain multiple documents.
+    OCR, clean and classify one segmented document.
 
     Args:
-        image: PIL Image of the page
-        text_content: OCR text from the entire page
+        detector: Shared IdentityCardDetector
         page_number: Original page number
+        idx: Zero-based index of the segment on the page
+        segment: DocumentSegment to process
 
     Returns:
-        List of IdentityCardClassification objects for each detected document
+        IdentityCardClassification for the segment
     """
     # Import locally to avoid circular dependency
-    from modules.identity_detection import IdentityCardClassification, IdentityCardDetector
     from modules.config_loader import get_config
     from utils.content_extraction import extract_text_content
     from utils.text_cleaner import clean_text
     from checks.clarity_check import calculate_ink_ratio
+
+    # Blank segments carry no readable text, so skip OCR for them. The default
+    # stays well below thin text strips (a lone header line is ~0.2% ink)
+    min_ink_ratio = get_config().get_setting('min_ocr_ink_ratio', 0.001)
+    ink_ratio, _ = calculate_ink_ratio(segment.image)
+    if ink_ratio < min_ink_ratio:
+        individual_text = ''
+    else:
+        # A single fast OCR pass; 'full' mode runs the same Tesseract
+        # configuration, so a second pass could never return more text
+        individual_text, _ = extract_text_content(segment.image, mode='fast')
+
+    # Clean the extracted text to remove unwanted characters
+    individual_text = clean_text(individual_text)
+
+    # Classify this individual document
+    classification = detector.classify_identity_document(
+        segment.image,
+        individual_text,
+        f"{page_number}-{idx+1}",  # Indicate this is sub-document
+        ink_ratio=ink_ratio
+    )
     
+    # Store bounding box in features for visualization
+    classification.features['bbox'] = segment.bbox
+    classification.features['segmented_image'] = segment.image
+
+    return classification
+
+
+def process_page_with_multiple_documents(image: Image.Image, text_content: str, page_number: int) -> List['IdentityCardClassification']:
+    """
+    Process a page that may contain multiple documents.
+
+    Segments are OCR'd and classified concurrently; Tesseract runs as a
+    subprocess, so threads overlap the OCR work.
+
+    Args:
+        image: PIL Image of the page
+        text_content: OCR text from the entire page
+        page_number: Original page number
+
+    Returns:
+        List of IdentityCardClassification objects for each detected document
+    """
     # First, try to segment the page into individual documents
     segmented_docs = segment_documents_on_page(image)
 
-    results = []
-
-    for idx, segment in enumerate(segmented_docs):
-        # Perform OCR on the individual document image with adaptive mode selection
-        # First try fast mode
-        individual_text, _ = extract_text_content(segment.image, mode='fast')
-        
-        # If text is too short or quality is poor, retry with full mode
-        if len(individual_text) < 30:  # If less than 30 chars, quality is likely poor
-            individual_text_full, _ = extract_text_content(segment.image, mode='full')
-            # Use full mode result if it's significantly better
-            if len(individual_text_full) > len(individual_text) * 1.5:
-                individual_text = individual_text_full
-
-        # Clean the extracted text to remove unwanted characters
-        individual_text = clean_text(individual_text)
-
-        # Classify this individual document
-        detector = IdentityCardDetector()
-        classification = detector.classify_identity_document(
-            segment.image,
-            individual_text,
-            f"{page_number}-{idx+1}"  # Indicate this is sub-document
-        )
-        
-        # Store bounding box in features for visualization
-        classification.features['bbox'] = segment.bbox
-        classification.features['segmented_image'] = segment.image
+    detector = _get_detector()
 
-        results.append(classification)
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(segmented_docs)))) as executor:
+        results = list(executor.map(
+            lambda item: _process_segment(detector, page_number, *item),
+            enumerate(segmented_docs)
+        ))
 
     return results
\ No newline at end of file
@@ -4,10 +4,15 @@ Document types and sides are fully configurable via config.json.
 """
 
 import fitz  # PyMuPDF
+import functools
+import re
+import itertools
+from collections import Counter, defaultdict
+from operator import attrgetter
 from PIL import Image
 from enum import Enum
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, NamedTuple
+from dataclasses import dataclass, field
 from utils.document_processor import extract_page_data
 from checks.clarity_check import calculate_ink_ratio
 from checks.confidence_check import calculate_ocr_confidence
@@ -17,6 +22,173 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 from utils.content_extraction import extract_text_content
 
+try:
+    import ahocorasick  # pyahocorasick, optional multi-keyword search
+except ImportError:
+    ahocorasick = None  # Fall back to a compiled regex alternation
+
+
+def _build_keyword_index(entries) -> Tuple[Dict[str, list], Optional[object], Optional[Tuple]]:
+    """
+    Build a lowercase keyword index for multi-keyword scans.
+    
+    Args:
+        entries: Iterable of (keyword, payload) pairs
+        
+    Returns:
+        Tuple of (dict mapping lowered keyword to its payloads, Aho-Corasick
+        automaton over the same keywords or None if pyahocorasick is missing,
+        regex fallback as (pattern, keyword prefixes) when there is no automaton)
+    """
+    index = {}
+    for keyword, payload in entries:
+        index.setdefault(keyword.lower(), []).append(payload)
+    
+    automaton = None
+    regex = None
+    if not index or '' in index:
+        # Nothing to compile (an empty keyword matches any text)
+        pass
+    elif ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword_lower in index:
+            automaton.add_word(keyword_lower, keyword_lower)
+        automaton.make_automaton()
+    else:
+        # Zero-width lookahead so a match is tried at every position; longest
+        # alternatives first, so each position reports its longest keyword and
+        # the shorter keywords starting there are exactly its keyword prefixes
+        ordered = sorted(index, key=len, reverse=True)
+        pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+        prefixes = {kw: [p for p in index if kw.startswith(p)] for kw in index}
+        regex = (pattern, prefixes)
+    return index, automaton, regex
+
+
+def _scan_keywords(keyword_index: Tuple[Dict[str, list], Optional[object], Optional[Tuple]], text_lower: str) -> list:
+    """
+    Find every indexed keyword contained in already-lowercased text.
+    
+    Args:
+        keyword_index: Result of _build_keyword_index
+        text_lower: Lowercased text to scan
+        
+    Returns:
+        List of payloads for all keywords present in the text (each keyword once)
+    """
+    index, automaton, regex = keyword_index
+    if automaton is not None:
+        # One linear pass over the text; repeated occurrences collapse in the set
+        found = {keyword_lower for _, keyword_lower in automaton.iter(text_lower)}
+    elif regex is not None:
+        # One C-level regex scan instead of a Python-level probe per keyword
+        pattern, prefixes = regex
+        found = set()
+        for longest in set(pattern.findall(text_lower)):
+            found.update(prefixes[longest])
+    else:
+        found = [keyword_lower for keyword_lower in index if keyword_lower in text_lower]
+    return [payload for keyword_lower in found for payload in index[keyword_lower]]
+
+
+# Config sections whose keywords are matched in one combined scan
+_KEYWORD_CATEGORIES = ('document_types', 'document_sides')
+
+# Shared read-only fallback for classifications without a content analysis
+_EMPTY_ANALYSIS: Dict[str, any] = {}
+
+# Side markers used by the post-classification heuristics
+_BACK_SIDE_MARKERS = ('firma', 'signature', 'scadenza', 'expiry', 'valid until', 'issued by', 
+                      'rilasciato', 'sigillo', 'timbro', 'qr code', 'barcode', 'mrz',
+                      'rilascio', 'questura', 'luogo d', 'place of birth')
+_FRONT_SIDE_MARKERS = ('identity card', 'carta d', 'nome', 'cognome', 'name', 'surname', 
+                       'data di nascita', 'date of birth', 'luogo di nascita', 'place of birth',
+                       'foto', 'photo', 'immagine', 'image', 'sesso', 'gender', 'cittadinanza', 
+                       'nationality', 'genere', 'domicilio', 'residenza')
+_BACK_MARKER_INDEX = _build_keyword_index((kw, kw) for kw in _BACK_SIDE_MARKERS)
+_FRONT_MARKER_INDEX = _build_keyword_index((kw, kw) for kw in _FRONT_SIDE_MARKERS)
+
+# Tie-breaker identifiers for close front/back side scores, as category bits
+_STRONG_FRONT = 1
+_STRONG_BACK = 2
+_STRONG_SIDE_INDEX = _build_keyword_index(
+    [(kw, _STRONG_FRONT) for kw in ('luogo di nascita', 'luogo d', 'nome e cognome', 'sesso',
+                                    'cittadinanza', 'numero di')] +
+    [(kw, _STRONG_BACK) for kw in ('firma', 'scadenza', 'valido', 'codice qr', 'qr code', 'mrz')])
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_document_content(text_lower: str) -> Dict[str, any]:
+    """
+    Analyze lowercased document content to determine likely side.
+    Memoized on the text: sub-documents and reruns often repeat the same OCR text.
+    Callers must not mutate the returned dictionary.
+    """
+    # Check for MRZ (Machine Readable Zone) - back side indicator
+    mrz_score = text_lower.count('<')  # Number of < characters (unaffected by lowercasing)
+    has_mrz_pattern = mrz_score >= 5
+    
+    # Check for back and front side keywords in one scan each
+    back_hits = _scan_keywords(_BACK_MARKER_INDEX, text_lower)
+    front_hits = _scan_keywords(_FRONT_MARKER_INDEX, text_lower)
+    
+    return {
+        'has_mrz': has_mrz_pattern,
+        'has_back_keywords': bool(back_hits),
+        'has_front_keywords': bool(front_hits),
+        'mrz_score': mrz_score,
+        'back_score': len(back_hits),
+        'front_score': len(front_hits)
+    }
+
+
+class _BoostConstants(NamedTuple):
+    """Confidence boost settings resolved once from config.json."""
+    triple_plus_match_boost: float
+    double_match_boost: float
+    single_match_boost: float
+    specificity_three_plus_words: float
+    specificity_two_words: float
+    specificity_single_word: float
+    max_specificity_bonus: float
+    consistency_three_plus_matches: float
+    consistency_two_matches: float
+    poor_ocr_threshold: float
+    poor_ocr_factor: float
+    medium_ocr_threshold: float
+    medium_ocr_factor: float
+    poor_ink_ratio_min: float
+    poor_ink_ratio_max: float
+    poor_ink_factor: float
+    max_confidence_cap: float
+    
+    @classmethod
+    def from_settings(cls, boost_settings: Optional[Dict]) -> '_BoostConstants':
+        """Build from the 'confidence_boost_settings' section, with the usual defaults."""
+        boost_settings = boost_settings or {}
+        quality_settings = boost_settings.get('quality_factors', {})
+        specificity_settings = boost_settings.get('specificity_bonus_per_word', {})
+        consistency_settings = boost_settings.get('consistency_bonus', {})
+        return cls(
+            triple_plus_match_boost=boost_settings.get('triple_plus_match_boost', 15.0),
+            double_match_boost=boost_settings.get('double_match_boost', 10.0),
+            single_match_boost=boost_settings.get('single_match_boost', 5.0),
+            specificity_three_plus_words=specificity_settings.get('three_plus_words', 3.0),
+            specificity_two_words=specificity_settings.get('two_words', 2.0),
+            specificity_single_word=specificity_settings.get('single_word', 1.0),
+            max_specificity_bonus=boost_settings.get('max_specificity_bonus', 10.0),
+            consistency_three_plus_matches=consistency_settings.get('three_plus_matches', 5.0),
+            consistency_two_matches=consistency_settings.get('two_matches', 3.0),
+            poor_ocr_threshold=quality_settings.get('poor_ocr_threshold', 30.0),
+            poor_ocr_factor=quality_settings.get('poor_ocr_factor', 0.5),
+            medium_ocr_threshold=quality_settings.get('medium_ocr_threshold', 50.0),
+            medium_ocr_factor=quality_settings.get('medium_ocr_factor', 0.75),
+            poor_ink_ratio_min=quality_settings.get('poor_ink_ratio_min', 0.05),
+            poor_ink_ratio_max=quality_settings.get('poor_ink_ratio_max', 0.8),
+            poor_ink_factor=quality_settings.get('poor_ink_factor', 0.8),
+            max_confidence_cap=boost_settings.get('max_confidence_cap', 100.0)
+        )
+
 
 # Document type enum - keys only, values from config.json
 class DocumentType(Enum):
@@ -35,7 +207,28 @@ class DocumentSide(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Side fixes for a two-document page where one side is UNKNOWN:
+# (side1, side2) -> (index of the document to update, its new side, heuristic name)
+_PAIR_SIDE_FIXES = {
+    (DocumentSide.FRONT, DocumentSide.UNKNOWN): (1, DocumentSide.BACK, 'paired_front_back'),
+    (DocumentSide.UNKNOWN, DocumentSide.FRONT): (0, DocumentSide.BACK, 'paired_front_back'),
+    (DocumentSide.BACK, DocumentSide.UNKNOWN): (1, DocumentSide.FRONT, 'paired_back_front'),
+    (DocumentSide.UNKNOWN, DocumentSide.BACK): (0, DocumentSide.FRONT, 'paired_back_front'),
+}
+
+# Keyword feature flags that earn the type (+30) and side (+25) confidence boosts
+_TYPE_KEYWORD_FLAGS = {
+    DocumentType.RESIDENTIAL_ID: 'has_residential_id_keywords',
+    DocumentType.AADHAAR: 'has_aadhaar_keywords',
+}
+_SIDE_KEYWORD_FLAGS = {
+    DocumentSide.FRONT: ('has_front_keywords',),
+    DocumentSide.BACK: ('has_back_keywords',),
+    DocumentSide.BOTH: ('has_front_keywords', 'has_back_keywords'),
+}
+
+
+@dataclass(slots=True)
 class IdentityCardClassification:
     """Data class for identity card classification results."""
     page_number: any  # Can be int or string (e.g., "1-1" for sub-documents)
@@ -44,6 +237,10 @@ class IdentityCardClassification:
     confidence: float
     text_content: str
     features: Dict[str, any]
+    page_root: str = field(init=False, repr=False)  # Page part of page_number ("1" for "1-2")
+    
+    def __post_init__(self):
+        self.page_root = str(self.page_number).partition('-')[0]
 
 
 class IdentityCardDetector:
@@ -56,16 +253,83 @@ class IdentityCardDetector:
         
         # All configuration comes from config.json - no hardcoded values
         # Document types and sides are loaded dynamically from config
+        
+        # Keyword maps and the combined keyword index, rebuilt when the config is reloaded
+        self._keyword_cache = None
+        # Keyword matches memoized on the text; cleared with the index
+        self._cached_keyword_matches = functools.lru_cache(maxsize=4096)(self._scan_keyword_matches)
+        # Resolved boost settings, paired with the config section they came from
+        self._boosts = None
     
     @property
     def document_type_keywords(self) -> Dict[str, Dict[str, List[str]]]:
-        """Get document type keywords from config."""
-        return self.config.get_all_document_type_keywords()
+        """Get document type keywords from config (cached until the config is reloaded)."""
+        return self._get_keyword_cache()[2]['document_types']
     
     @property
     def document_side_keywords(self) -> Dict[str, Dict[str, List[str]]]:
-        """Get document side keywords from config."""
-        return self.config.get_all_document_side_keywords()
+        """Get document side keywords from config (cached until the config is reloaded)."""
+        return self._get_keyword_cache()[2]['document_sides']
+    
+    def _get_keyword_cache(self) -> Tuple[Tuple, Tuple, Dict[str, Dict[str, Dict[str, List[str]]]]]:
+        """
+        Get the keyword data for document types and sides.
+        Rebuilt whenever either config section object changes (reload).
+        
+        Returns:
+            Tuple of (config sections, keyword index over both categories with
+            (category, key, lang, keyword) payloads, keyword maps per category)
+        """
+        sources = tuple(self.config.get(category) for category in _KEYWORD_CATEGORIES)
+        cached = self._keyword_cache
+        if cached is None or any(old is not new for old, new in zip(cached[0], sources)):
+            keyword_maps = {
+                category: {key: data.get('keywords', {}) for key, data in (source or {}).items()}
+                for category, source in zip(_KEYWORD_CATEGORIES, sources)
+            }
+            index = _build_keyword_index(
+                (keyword, (category, key, lang, keyword))
+                for category, keyword_map in keyword_maps.items()
+                for key, groups in keyword_map.items()
+                for lang, keywords in groups.items()
+                for keyword in keywords
+            )
+            cached = (sources, index, keyword_maps)
+            self._keyword_cache = cached
+            self._cached_keyword_matches.cache_clear()
+        return cached
+    
+    def _get_boost_constants(self) -> _BoostConstants:
+        """Get the confidence boost settings, re-resolved when the config is reloaded."""
+        source = self.config.get('confidence_boost_settings')
+        if self._boosts is None or self._boosts[0] is not source:
+            self._boosts = (source, _BoostConstants.from_settings(source))
+        return self._boosts[1]
+    
+    def _match_keywords(self, text_lower: str) -> Dict[str, Dict[str, frozenset]]:
+        """
+        Scan lowercased text once for the keywords of all document types and sides.
+        Results are memoized per detector; callers must not mutate them.
+        
+        Args:
+            text_lower: Lowercased text
+            
+        Returns:
+            Dictionary mapping 'document_types' / 'document_sides' to a dictionary
+            of each matched type/side key to a frozenset of (lang, keyword)
+        """
+        # Refresh the index first so a config reload clears stale matches
+        self._get_keyword_cache()
+        return self._cached_keyword_matches(text_lower)
+    
+    def _scan_keyword_matches(self, text_lower: str) -> Dict[str, Dict[str, frozenset]]:
+        """Uncached body of _match_keywords."""
+        matches = {category: {} for category in _KEYWORD_CATEGORIES}
+        for category, key, lang, keyword in _scan_keywords(self._get_keyword_cache()[1], text_lower):
+            matches[category].setdefault(key, set()).add((lang, keyword))
+        # Frozen so the memoized result can be shared between classifications
+        return {category: {key: frozenset(hits) for key, hits in found.items()}
+                for category, found in matches.items()}
 
     def detect_identity_documents(self, file_bytes: bytes, file_name: str) -> List[IdentityCardClassification]:
         """
@@ -83,22 +347,15 @@ class IdentityCardDetector:
             List of IdentityCardClassification objects with detection results
         """
         results = []
-        all_classifications = []
         
         # Extract page data using existing functionality
         page_data_list, _ = extract_page_data(file_bytes, file_name)
         
         # Single pass: Process all pages and collect classifications
-        for page_data in page_data_list:
-            page_num = page_data['page']
-            image = page_data['image']
-            text_content = page_data['text_content']
-            
-            # Process the page for multiple documents
-            from modules.document_segmentation import process_page_with_multiple_documents
-            page_results = process_page_with_multiple_documents(image, text_content, page_num)
-            
-            all_classifications.extend(page_results)
+        # (each page already OCRs its segments on a small thread pool)
+        all_classifications = list(itertools.chain.from_iterable(
+            _process_page(page_data) for page_data in page_data_list
+        ))
         
         # Post-hoc analysis: Calculate keyword frequency across all documents
         keyword_frequency = self._analyze_keyword_frequency(all_classifications)
@@ -128,40 +385,10 @@ class IdentityCardDetector:
         Returns:
             Updated list of classifications with heuristics applied
         """
-        # Helper function to analyze document content
-        def analyze_document_content(text):
-            """Analyze document content to determine likely side."""
-            text_lower = text.lower()
-            text_raw = text
-            
-            # Check for MRZ (Machine Readable Zone) - back side indicator
-            has_mrz_pattern = '<' in text_raw and text_raw.count('<') >= 5
-            
-            # Check for back side keywords
-            back_keywords = ['firma', 'signature', 'scadenza', 'expiry', 'valid until', 'issued by', 
-                           'rilasciato', 'sigillo', 'timbro', 'qr code', 'barcode', 'mrz',
-                           'rilascio', 'questura', 'luogo d', 'place of birth']
-            has_back_keywords = any(keyword in text_lower for keyword in back_keywords)
-            
-            # Check for front side keywords
-            front_keywords = ['identity card', 'carta d', 'nome', 'cognome', 'name', 'surname', 
-                            'data di nascita', 'date of birth', 'luogo di nascita', 'place of birth',
-                            'foto', 'photo', 'immagine', 'image', 'sesso', 'gender', 'cittadinanza', 
-                            'nationality', 'genere', 'domicilio', 'residenza']
-            has_front_keywords = any(keyword in text_lower for keyword in front_keywords)
-            
-            return {
-                'has_mrz': has_mrz_pattern,
-                'has_back_keywords': has_back_keywords,
-                'has_front_keywords': has_front_keywords,
-                'mrz_score': text_raw.count('<'),  # Number of < characters
-                'back_score': sum(1 for kw in back_keywords if kw in text_lower),
-                'front_score': sum(1 for kw in front_keywords if kw in text_lower)
-            }
-        
         # Analyze all documents
         for classification in classifications:
-            analysis = analyze_document_content(classification.text_content)
+            text_lower = self._get_text_lower(classification.text_content, classification.features)
+            analysis = dict(_analyze_document_content(text_lower))
             classification.features['content_analysis'] = analysis
             
             # Determine side based on content markers (with priority order)
@@ -186,39 +413,36 @@ class IdentityCardDetector:
                     classification.document_side = DocumentSide.BACK
                     classification.features['detection_method'] = 'back_keywords_priority'
         
-        # Second pass: Group by page and fix mismatches
-        by_page = {}
-        for idx, classification in enumerate(classifications):
-            page_key = str(classification.page_number).split('-')[0]
-            if page_key not in by_page:
-                by_page[page_key] = []
-            by_page[page_key].append((idx, classification))
+        # Second pass: Group by page and fix mismatches. Group a stably sorted
+        # copy so the returned list keeps its original order.
+        by_page = itertools.groupby(sorted(classifications, key=attrgetter('page_root')),
+                                    key=attrgetter('page_root'))
         
         # For pages with multiple documents, ensure coherence and proper front/back pairing
-        for page_num, docs in by_page.items():
+        for page_num, group in by_page:
+            docs = list(group)
             if len(docs) == 2:
-                idx1, doc1 = docs[0]
-                idx2, doc2 = docs[1]
+                doc1, doc2 = docs
+                analysis1 = doc1.features.get('content_analysis') or _EMPTY_ANALYSIS
+                analysis2 = doc2.features.get('content_analysis') or _EMPTY_ANALYSIS
                 
                 # First, fix document types
-                if doc1.document_type.value == 'unknown' and doc2.document_type.value == 'unknown':
+                if doc1.document_type is DocumentType.UNKNOWN and doc2.document_type is DocumentType.UNKNOWN:
                     # Both unknown - check which has better keyword match
-                    score1 = doc1.features.get('content_analysis', {}).get('front_score', 0) + \
-                             doc1.features.get('content_analysis', {}).get('back_score', 0)
-                    score2 = doc2.features.get('content_analysis', {}).get('front_score', 0) + \
-                             doc2.features.get('content_analysis', {}).get('back_score', 0)
+                    score1 = analysis1.get('front_score', 0) + analysis1.get('back_score', 0)
+                    score2 = analysis2.get('front_score', 0) + analysis2.get('back_score', 0)
                     
                     if score1 > 0 or score2 > 0:
                         doc1.document_type = DocumentType.RESIDENTIAL_ID
                         doc2.document_type = DocumentType.RESIDENTIAL_ID
                 
                 # If one is known and other is unknown, propagate the type
-                elif doc1.document_type.value != 'unknown' and doc2.document_type.value == 'unknown':
+                elif doc1.document_type is not DocumentType.UNKNOWN and doc2.document_type is DocumentType.UNKNOWN:
                     doc2.document_type = doc1.document_type
                     doc2.confidence = max(doc2.confidence, 65.0)
                     doc2.features['heuristic_applied'] = 'matched_with_pair'
                 
-                elif doc2.document_type.value != 'unknown' and doc1.document_type.value == 'unknown':
+                elif doc2.document_type is not DocumentType.UNKNOWN and doc1.document_type is DocumentType.UNKNOWN:
                     doc1.document_type = doc2.document_type
                     doc1.confidence = max(doc1.confidence, 65.0)
                     doc1.features['heuristic_applied'] = 'matched_with_pair'
@@ -227,26 +451,18 @@ class IdentityCardDetector:
                 side1 = doc1.document_side
                 side2 = doc2.document_side
                 
-                # If one is clearly FRONT and other is UNKNOWN, assume other is BACK
-                if side1 == DocumentSide.FRONT and side2 == DocumentSide.UNKNOWN:
-                    doc2.document_side = DocumentSide.BACK
-                    doc2.features['heuristic_applied'] = 'paired_front_back'
-                elif side2 == DocumentSide.FRONT and side1 == DocumentSide.UNKNOWN:
-                    doc1.document_side = DocumentSide.BACK
-                    doc1.features['heuristic_applied'] = 'paired_front_back'
-                
-                # If one is clearly BACK and other is UNKNOWN, assume other is FRONT
-                elif side1 == DocumentSide.BACK and side2 == DocumentSide.UNKNOWN:
-                    doc2.document_side = DocumentSide.FRONT
-                    doc2.features['heuristic_applied'] = 'paired_back_front'
-                elif side2 == DocumentSide.BACK and side1 == DocumentSide.UNKNOWN:
-                    doc1.document_side = DocumentSide.FRONT
-                    doc1.features['heuristic_applied'] = 'paired_back_front'
+                # One side known and the other UNKNOWN: the unknown one is the opposite side
+                pair_fix = _PAIR_SIDE_FIXES.get((side1, side2))
+                if pair_fix is not None:
+                    target_idx, new_side, method = pair_fix
+                    target = docs[target_idx]
+                    target.document_side = new_side
+                    target.features['heuristic_applied'] = method
                 
                 # If both are BACK (unlikely but handle it), re-evaluate the one without MRZ
-                elif side1 == DocumentSide.BACK and side2 == DocumentSide.BACK:
-                    has_mrz1 = doc1.features.get('content_analysis', {}).get('has_mrz', False)
-                    has_mrz2 = doc2.features.get('content_analysis', {}).get('has_mrz', False)
+                elif side1 is DocumentSide.BACK and side2 is DocumentSide.BACK:
+                    has_mrz1 = analysis1.get('has_mrz', False)
+                    has_mrz2 = analysis2.get('has_mrz', False)
                     
                     # If only one has MRZ, the other should be FRONT
                     if has_mrz1 and not has_mrz2:
@@ -268,61 +484,52 @@ class IdentityCardDetector:
         Returns:
             Dictionary with keyword frequency statistics
         """
-        keyword_frequency = {
-            'document_types': {},
-            'document_sides': {},
-            'specific_keywords': {},
-            'total_documents': len(classifications)
-        }
+        def new_entry():
+            return {'count': 0, 'documents': [], 'specific_keywords': set()}
+        
+        type_frequency = defaultdict(new_entry)
+        side_frequency = defaultdict(new_entry)
+        specific_frequency = Counter()
         
         for classification in classifications:
             features = classification.features
+            matched_keywords = features.get('matched_keywords')
+            if matched_keywords is None:
+                text_lower = self._get_text_lower(classification.text_content, features)
+                matched_keywords = self._match_keywords(text_lower)
             
             # Track document type matches
             type_matches = features.get('document_type_keyword_matches', {})
             for doc_type, matched in type_matches.items():
                 if matched:
-                    if doc_type not in keyword_frequency['document_types']:
-                        keyword_frequency['document_types'][doc_type] = {
-                            'count': 0,
-                            'documents': [],
-                            'specific_keywords': set()
-                        }
-                    keyword_frequency['document_types'][doc_type]['count'] += 1
-                    keyword_frequency['document_types'][doc_type]['documents'].append(classification.page_number)
+                    entry = type_frequency[doc_type]
+                    entry['count'] += 1
+                    entry['documents'].append(classification.page_number)
                     
-                    # Track which specific keywords matched
-                    text_lower = classification.text_content.lower()
-                    type_keywords = self.document_type_keywords.get(doc_type, {})
-                    for lang, keywords in type_keywords.items():
-                        for keyword in keywords:
-                            if keyword.lower() in text_lower:
-                                keyword_frequency['document_types'][doc_type]['specific_keywords'].add(keyword)
-                                # Track per-keyword frequency
-                                if keyword not in keyword_frequency['specific_keywords']:
-                                    keyword_frequency['specific_keywords'][keyword] = 0
-                                keyword_frequency['specific_keywords'][keyword] += 1
+                    # Track which specific keywords matched, and how often
+                    keywords = [keyword for _, keyword in matched_keywords['document_types'].get(doc_type, ())]
+                    entry['specific_keywords'].update(keywords)
+                    specific_frequency.update(keywords)
             
             # Track document side matches
             side_matches = features.get('document_side_keyword_matches', {})
             for side, matched in side_matches.items():
                 if matched:
-                    if side not in keyword_frequency['document_sides']:
-                        keyword_frequency['document_sides'][side] = {
-                            'count': 0,
-                            'documents': [],
-                            'specific_keywords': set()
-                        }
-                    keyword_frequency['document_sides'][side]['count'] += 1
-                    keyword_frequency['document_sides'][side]['documents'].append(classification.page_number)
+                    entry = side_frequency[side]
+                    entry['count'] += 1
+                    entry['documents'].append(classification.page_number)
                     
                     # Track which specific keywords matched
-                    text_lower = classification.text_content.lower()
-                    side_keywords = self.document_side_keywords.get(side, {})
-                    for lang, keywords in side_keywords.items():
-                        for keyword in keywords:
-                            if keyword.lower() in text_lower:
-                                keyword_frequency['document_sides'][side]['specific_keywords'].add(keyword)
+                    entry['specific_keywords'].update(
+                        keyword for _, keyword in matched_keywords['document_sides'].get(side, ()))
+        
+        # Plain dicts so lookups of unseen keys don't insert entries
+        keyword_frequency = {
+            'document_types': dict(type_frequency),
+            'document_sides': dict(side_frequency),
+            'specific_keywords': dict(specific_frequency),
+            'total_documents': len(classifications)
+        }
         
         return keyword_frequency
     
@@ -337,6 +544,12 @@ class IdentityCardDetector:
             classification: Classification to adjust
             keyword_frequency: Frequency analysis results
         """
+        # Get ALL boost settings from config (resolved once per config load)
+        boosts = self._get_boost_constants()
+        
+        type_matches = classification.features.get('document_type_keyword_matches', {})
+        side_matches = classification.features.get('document_side_keyword_matches', {})
+        
         base_confidence = classification.confidence
         adjustment = 0.0
         adjustment_details = {
@@ -349,16 +562,7 @@ class IdentityCardDetector:
             'cross_document_matches': 0
         }
         
-        # Get ALL boost settings from config
-        boost_settings = self.config.get('confidence_boost_settings', {})
-        quality_settings = boost_settings.get('quality_factors', {})
-        specificity_settings = boost_settings.get('specificity_bonus_per_word', {})
-        consistency_settings = boost_settings.get('consistency_bonus', {})
-        
         # Calculate frequency-based boost
-        type_matches = classification.features.get('document_type_keyword_matches', {})
-        side_matches = classification.features.get('document_side_keyword_matches', {})
-        
         matched_types = [t for t, m in type_matches.items() if m]
         matched_sides = [s for s, m in side_matches.items() if m]
         
@@ -377,11 +581,11 @@ class IdentityCardDetector:
         
         # Apply frequency boost with diminishing returns (from config)
         if cross_doc_matches >= 3:
-            adjustment_details['frequency_boost'] = boost_settings.get('triple_plus_match_boost', 15.0)
+            adjustment_details['frequency_boost'] = boosts.triple_plus_match_boost
         elif cross_doc_matches == 2:
-            adjustment_details['frequency_boost'] = boost_settings.get('double_match_boost', 10.0)
+            adjustment_details['frequency_boost'] = boosts.double_match_boost
         elif cross_doc_matches == 1:
-            adjustment_details['frequency_boost'] = boost_settings.get('single_match_boost', 5.0)
+            adjustment_details['frequency_boost'] = boosts.single_match_boost
         
         # Apply specificity bonus (longer keywords = more specific = higher bonus)
         specificity_bonus = 0.0
@@ -392,21 +596,21 @@ class IdentityCardDetector:
                     # Longer keywords are more specific (values from config)
                     word_count = len(keyword.split())
                     if word_count >= 3:
-                        specificity_bonus += specificity_settings.get('three_plus_words', 3.0)
+                        specificity_bonus += boosts.specificity_three_plus_words
                     elif word_count == 2:
-                        specificity_bonus += specificity_settings.get('two_words', 2.0)
+                        specificity_bonus += boosts.specificity_two_words
                     else:
-                        specificity_bonus += specificity_settings.get('single_word', 1.0)
+                        specificity_bonus += boosts.specificity_single_word
         
         # Cap specificity bonus (from config)
-        max_specificity = boost_settings.get('max_specificity_bonus', 10.0)
+        max_specificity = boosts.max_specificity_bonus
         adjustment_details['specificity_bonus'] = min(specificity_bonus, max_specificity)
         
         # Apply consistency bonus (multiple different keywords matching)
         if total_keyword_matches >= 3:
-            adjustment_details['consistency_bonus'] = consistency_settings.get('three_plus_matches', 5.0)
+            adjustment_details['consistency_bonus'] = boosts.consistency_three_plus_matches
         elif total_keyword_matches >= 2:
-            adjustment_details['consistency_bonus'] = consistency_settings.get('two_matches', 3.0)
+            adjustment_details['consistency_bonus'] = boosts.consistency_two_matches
         
         # Apply quality factor (reduce boost for low-quality documents) - ALL from config
         ocr_confidence = classification.features.get('ocr_confidence', 0)
@@ -415,10 +619,10 @@ class IdentityCardDetector:
         quality_factor = 1.0
         
         # OCR quality factor
-        poor_ocr_threshold = quality_settings.get('poor_ocr_threshold', 30.0)
-        poor_ocr_factor = quality_settings.get('poor_ocr_factor', 0.5)
-        medium_ocr_threshold = quality_settings.get('medium_ocr_threshold', 50.0)
-        medium_ocr_factor = quality_settings.get('medium_ocr_factor', 0.75)
+        poor_ocr_threshold = boosts.poor_ocr_threshold
+        poor_ocr_factor = boosts.poor_ocr_factor
+        medium_ocr_threshold = boosts.medium_ocr_threshold
+        medium_ocr_factor = boosts.medium_ocr_factor
         
         if ocr_confidence < poor_ocr_threshold:
             quality_factor = poor_ocr_factor
@@ -426,9 +630,9 @@ class IdentityCardDetector:
             quality_factor = medium_ocr_factor
         
         # Ink ratio quality factor
-        poor_ink_min = quality_settings.get('poor_ink_ratio_min', 0.05)
-        poor_ink_max = quality_settings.get('poor_ink_ratio_max', 0.8)
-        poor_ink_factor = quality_settings.get('poor_ink_factor', 0.8)
+        poor_ink_min = boosts.poor_ink_ratio_min
+        poor_ink_max = boosts.poor_ink_ratio_max
+        poor_ink_factor = boosts.poor_ink_factor
         
         if ink_ratio < poor_ink_min or ink_ratio > poor_ink_max:
             quality_factor *= poor_ink_factor
@@ -444,13 +648,14 @@ class IdentityCardDetector:
         adjustment_details['total_adjustment'] = adjustment
         
         # Apply adjustment with cap (from config)
-        max_confidence = boost_settings.get('max_confidence_cap', 100.0)
+        max_confidence = boosts.max_confidence_cap
         classification.confidence = min(max_confidence, base_confidence + adjustment)
         
         # Store adjustment details in features for UI display
         classification.features['confidence_adjustment'] = adjustment_details
     
-    def classify_identity_document(self, image: Image.Image, text_content: str, page_number: int) -> IdentityCardClassification:
+    def classify_identity_document(self, image: Image.Image, text_content: str, page_number: int,
+                                   ink_ratio: Optional[float] = None) -> IdentityCardClassification:
         """
         Classify a single identity document page.
         
@@ -458,12 +663,13 @@ class IdentityCardDetector:
             image: PIL Image of the document page
             text_content: Extracted text from the document
             page_number: Page number in the document
+            ink_ratio: Ink ratio already computed for this image, if any
             
         Returns:
             IdentityCardClassification object with the classification results
         """
         # Calculate various features for classification
-        features = self._extract_features(image, text_content)
+        features = self._extract_features(image, text_content, ink_ratio)
         
         # Determine document type
         doc_type = self._classify_document_type(text_content, features)
@@ -483,12 +689,14 @@ class IdentityCardDetector:
             features=features
         )
     
-    def _extract_features(self, image: Image.Image, text_content: str) -> Dict[str, any]:
+    def _extract_features(self, image: Image.Image, text_content: str,
+                          ink_ratio: Optional[float] = None) -> Dict[str, any]:
         """Extract features from the image and text for classification."""
         features = {}
         
-        # Image-based features
-        ink_ratio, _ = calculate_ink_ratio(image)
+        # Image-based features (reuse the caller's ink ratio for this image)
+        if ink_ratio is None:
+            ink_ratio, _ = calculate_ink_ratio(image)
         features['ink_ratio'] = ink_ratio
         
         # Request verbose OCR confidence logging when debug enabled
@@ -500,16 +708,23 @@ class IdentityCardDetector:
         features['text_length'] = len(text_content)
         features['word_count'] = len(text_content.split())
         
-        # Check for presence of keywords from config
+        # Check for presence of keywords from config (one scan for types and sides)
+        text_lower = text_content.lower()
+        features['_text_lower'] = text_lower  # Reused by the classifiers and heuristics
+        matched_keywords = self._match_keywords(text_lower)
+        features['matched_keywords'] = matched_keywords
+        type_hits = matched_keywords['document_types']
+        side_hits = matched_keywords['document_sides']
+        
         features['document_type_keyword_matches'] = {}
-        for doc_type, keywords in self.document_type_keywords.items():
-            has_keywords = self._has_keywords(text_content, keywords)
+        for doc_type in self.document_type_keywords:
+            has_keywords = doc_type in type_hits
             features[f'has_{doc_type}_keywords'] = has_keywords
             features['document_type_keyword_matches'][doc_type] = has_keywords
         
         features['document_side_keyword_matches'] = {}
-        for side, keywords in self.document_side_keywords.items():
-            has_keywords = self._has_keywords(text_content, keywords)
+        for side in self.document_side_keywords:
+            has_keywords = side in side_hits
             features[f'has_{side}_keywords'] = has_keywords
             features['document_side_keyword_matches'][side] = has_keywords
         
@@ -523,37 +738,41 @@ class IdentityCardDetector:
 
         return features
     
-    def _has_keywords(self, text: str, keyword_groups: Dict[str, List[str]]) -> bool:
-        """Check if text contains any of the provided keywords."""
-        text_lower = text.lower()
-        for lang, keywords in keyword_groups.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    return True
-        return False
+    def _get_text_lower(self, text_content: str, features: Dict[str, any]) -> str:
+        """Get the lowercased text cached by _extract_features, lowering only if it is missing."""
+        text_lower = features.get('_text_lower')
+        if text_lower is None:
+            text_lower = text_content.lower()
+        return text_lower
+    
+    def _get_matched_keywords(self, text_lower: str, features: Dict[str, any], category: str) -> Dict[str, frozenset]:
+        """Get the keyword matches found by _extract_features, scanning only if they are missing."""
+        matched_keywords = features.get('matched_keywords')
+        if matched_keywords is None:
+            matched_keywords = self._match_keywords(text_lower)
+        return matched_keywords[category]
     
     def _classify_document_type(self, text_content: str, features: Dict[str, any]) -> DocumentType:
         """Classify the document type based on text and features.
         
         Uses config-based keywords - no hardcoded values.
         """
-        text_lower = text_content.lower()
+        text_lower = self._get_text_lower(text_content, features)
         
         # Check each configured document type
         best_match = None
         best_score = 0
         
-        for doc_type, keywords in self.document_type_keywords.items():
+        type_hits = self._get_matched_keywords(text_lower, features, 'document_types')
+        
+        for doc_type in self.config.get('document_types', {}):
             score = 0
             
-            # Check English keywords
-            for keyword in keywords.get('en', []):
-                if keyword.lower() in text_lower:
+            # Score English (2) and other language (1) keywords from the single scan
+            for lang, keyword in type_hits.get(doc_type, ()):
+                if lang == 'en':
                     score += 2
-            
-            # Check other language keywords
-            for keyword in keywords.get('other', []):
-                if keyword.lower() in text_lower:
+                elif lang == 'other':
                     score += 1
             
             # Check if feature flag is set
@@ -580,7 +799,7 @@ class IdentityCardDetector:
     
     def _classify_document_side(self, text_content: str, features: Dict[str, any]) -> DocumentSide:
         """Classify the document side based on text and features."""
-        text_lower = text_content.lower()
+        text_lower = self._get_text_lower(text_content, features)
         
         # Check each configured document side
         side_scores = {}
@@ -597,19 +816,18 @@ class IdentityCardDetector:
         ocr_conf = float(features.get('ocr_confidence', 0))
         apply_mul = (moderate_min <= ocr_conf <= moderate_max)
 
-        for side, keywords in self.document_side_keywords.items():
+        side_hits = self._get_matched_keywords(text_lower, features, 'document_sides')
+        
+        for side in self.config.get('document_sides', {}):
             score = 0.0
-
-            # Check English keywords
-            for keyword in keywords.get('en', []):
-                if keyword.lower() in text_lower:
+            
+            # Score English and other language keywords from the single scan
+            for lang, keyword in side_hits.get(side, ()):
+                if lang == 'en':
                     score += en_weight * (moderate_mul if apply_mul else 1.0)
-
-            # Check other language keywords
-            for keyword in keywords.get('other', []):
-                if keyword.lower() in text_lower:
+                elif lang == 'other':
                     score += other_weight * (moderate_mul if apply_mul else 1.0)
-
+            
             # Check if feature flag is set
             if features.get(f'has_{side}_keywords', False):
                 score += feature_weight * (moderate_mul if apply_mul else 1.0)
@@ -631,9 +849,12 @@ class IdentityCardDetector:
                 # Scores are too close; use tie-breaker: Italian IDs that show personal identifiers are typically FRONT
                 # Keywords like "luogo di nascita", "nome", "cognome", "sesso" appear on front
                 # Keywords like "firma", "scadenza", "qr" appear on back
-                # Check for strong front identifiers
-                has_strong_front = any(word in text_lower for word in ['luogo di nascita', 'luogo d', 'nome e cognome', 'sesso', 'cittadinanza', 'numero di'])
-                has_strong_back = any(word in text_lower for word in ['firma', 'scadenza', 'valido', 'codice qr', 'qr code', 'mrz'])
+                # Check for strong front and back identifiers in one scan
+                mask = 0
+                for bit in _scan_keywords(_STRONG_SIDE_INDEX, text_lower):
+                    mask |= bit
+                has_strong_front = bool(mask & _STRONG_FRONT)
+                has_strong_back = bool(mask & _STRONG_BACK)
                 
                 if has_strong_front and not has_strong_back:
                     return DocumentSide.FRONT
@@ -663,17 +884,13 @@ class IdentityCardDetector:
         confidence += ocr_conf * 0.3
         
         # Boost confidence if specific document type keywords were found (weight: up to 30%)
-        if doc_type != DocumentType.UNKNOWN:
-            if doc_type == DocumentType.RESIDENTIAL_ID and features.get('has_residential_id_keywords', False):
-                confidence += 30.0
-            elif doc_type == DocumentType.AADHAAR and features.get('has_aadhaar_keywords', False):
-                confidence += 30.0
+        type_flag = _TYPE_KEYWORD_FLAGS.get(doc_type)
+        if type_flag is not None and features.get(type_flag, False):
+            confidence += 30.0
         
         # Boost confidence if specific side keywords were found (weight: up to 25%)
-        if doc_side != DocumentSide.UNKNOWN:
-            if doc_side in [DocumentSide.FRONT, DocumentSide.BOTH] and features.get('has_front_keywords', False):
-                confidence += 25.0
-            if doc_side in [DocumentSide.BACK, DocumentSide.BOTH] and features.get('has_back_keywords', False):
+        for side_flag in _SIDE_KEYWORD_FLAGS.get(doc_side, ()):
+            if features.get(side_flag, False):
                 confidence += 25.0
         
         # Adjust for document clarity based on ink ratio (weight: up to 15%)
@@ -698,6 +915,20 @@ class IdentityCardDetector:
         return confidence
 
 
+def _process_page(page_data: Dict[str, any]) -> List[IdentityCardClassification]:
+    """
+    Segment and classify the documents on one page.
+    
+    Args:
+        page_data: Page dictionary from extract_page_data
+        
+    Returns:
+        List of IdentityCardClassification objects for the page
+    """
+    from modules.document_segmentation import process_page_with_multiple_documents
+    return process_page_with_multiple_documents(page_data['image'], page_data['text_content'], page_data['page'])
+
+
 def process_identity_documents(file_bytes: bytes, file_name: str) -> List[IdentityCardClassification]:
     """
     Main function to process identity documents in a PDF file.
@@ -723,18 +954,10 @@ def group_identity_documents(classifications: List[IdentityCardClassification])
     Returns:
         Dictionary grouping classifications by document type
     """
-    grouped = {
-        'residential_id': [],
-        'aadhaar': [],
-        'unknown': []
-    }
+    # One bucket per DocumentType, keyed by its value
+    grouped = {doc_type.value: [] for doc_type in DocumentType}
     
     for classification in classifications:
-        if classification.document_type == DocumentType.RESIDENTIAL_ID:
-            grouped['residential_id'].append(classification)
-        elif classification.document_type == DocumentType.AADHAAR:
-            grouped['aadhaar'].append(classification)
-        else:
-            grouped['unknown'].append(classification)
+        grouped[classification.document_type.value].append(classification)
     
     return grouped
\ No newline at end of file
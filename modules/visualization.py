@@ -3,11 +3,22 @@ Visualization utilities for identity card detection.
 """
 
 import cv2
+import functools
 import numpy as np
 from PIL import Image
 from typing import List, Tuple, Dict
 from modules.document_segmentation import DocumentSegment
 
+# Label text style, shared by every box
+_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_LABEL_FONT_SCALE = 0.6
+
+
+@functools.lru_cache(maxsize=256)
+def _label_size(label: str, line_width: int) -> Tuple[Tuple[int, int], int]:
+    """Return cv2.getTextSize for a label; repeated labels are measured once."""
+    return cv2.getTextSize(label, _LABEL_FONT, _LABEL_FONT_SCALE, line_width)
+
 
 def draw_bounding_boxes(image: Image.Image, 
                        bounding_boxes: List[Tuple[int, int, int, int]], 
@@ -27,12 +38,14 @@ def draw_bounding_boxes(image: Image.Image,
     Returns:
         PIL Image with bounding boxes drawn
     """
-    # Convert to OpenCV format
-    img_cv = np.array(image)
-    if len(img_cv.shape) == 2:
-        img_cv = cv2.cvtColor(img_cv, cv2.COLOR_GRAY2BGR)
+    # Draw straight onto an RGB copy; no BGR round-trip
+    img_cv = np.asarray(image)
+    if img_cv.ndim == 2:
+        img_cv = cv2.cvtColor(img_cv, cv2.COLOR_GRAY2RGB)
+    elif img_cv.shape[2] == 4:
+        img_cv = cv2.cvtColor(img_cv, cv2.COLOR_RGBA2RGB)
     else:
-        img_cv = cv2.cvtColor(img_cv, cv2.COLOR_RGB2BGR)
+        img_cv = img_cv.copy()
     
     # Default colors if not provided
     if colors is None:
@@ -48,8 +61,11 @@ def draw_bounding_boxes(image: Image.Image,
     for idx, bbox in enumerate(bounding_boxes):
         x, y, w, h = bbox
         
-        # Get color (cycle through if not enough colors)
+        # Get color (cycle through if not enough colors). Boxes have always
+        # been drawn with the tuple applied in BGR order, so reverse it to
+        # keep the same on-screen colors on the RGB buffer.
         color = colors[idx % len(colors)] if colors else (255, 0, 0)
+        color = tuple(color[::-1])
         
         # Draw rectangle
         cv2.rectangle(img_cv, (x, y), (x + w, y + h), color, line_width)
@@ -59,11 +75,7 @@ def draw_bounding_boxes(image: Image.Image,
             label = labels[idx % len(labels)]
             
             # Calculate label background size
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            font_scale = 0.6
-            (text_width, text_height), baseline = cv2.getTextSize(
-                label, font, font_scale, line_width
-            )
+            (text_width, text_height), baseline = _label_size(label, line_width)
             
             # Draw label background
             cv2.rectangle(
@@ -79,16 +91,14 @@ def draw_bounding_boxes(image: Image.Image,
                 img_cv,
                 label,
                 (x, y - baseline),
-                font,
-                font_scale,
+                _LABEL_FONT,
+                _LABEL_FONT_SCALE,
                 (255, 255, 255),  # White text
                 line_width,
                 cv2.LINE_AA
             )
     
-    # Convert back to PIL
-    img_pil = Image.fromarray(cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB))
-    return img_pil
+    return Image.fromarray(img_cv)
 
 
 def draw_segmentation_results(image: Image.Image, 
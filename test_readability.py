@@ -37,6 +37,33 @@ OCR_MODE = 'fast'  # 'superfast', 'fast', 'balanced', or 'accurate'
                    # 'fast' = good balance (recommended)
                    # 'accurate' = slowest but most accurate
 
+# Parallel processing
+DEFAULT_JOBS = None  # Number of files processed in parallel
+                     # None = one worker per 4 CPU cores (at least 1)
+                     # 1 = process files one at a time
+                     # Can be overridden with --jobs command line flag
+
+# Skip OCR on blank pages
+DEFAULT_SKIP_OCR_ON_EMPTY = False  # False = OCR every page, even blank ones (results match app.py)
+                                   # True = pages below the emptiness threshold are not OCR'd
+                                   #        (confidence 0, not readable) - saves a Tesseract pass per blank page,
+                                   #        but lowers average confidence compared to a full run
+                                  # Can be overridden with --skip-ocr-on-empty / --no-skip-ocr-on-empty
+
+# OCR resolution
+DEFAULT_OCR_MAX_DIM = None  # Longest side (pixels) pages are downscaled to before OCR
+                            # None = OCR at full resolution (scores match the calibrated thresholds)
+                            # e.g. 2000 = faster OCR on high-DPI scans, confidence may shift slightly
+                            # Can be overridden with --ocr-max-dim command line flag
+
+# OCR cache
+DEFAULT_CACHE_DIR = None  # Folder for cached per-page OCR results, keyed on a hash of the file contents,
+                         # so unchanged files are not OCR'd again on the next run
+                         # None = no cache (nothing is written to disk besides the report)
+                         # The cache holds the full extracted text of every page in plain JSON and is
+                         # never cleaned up - only point it at a folder that may hold document contents
+                         # Can be overridden with --cache-dir command line flag
+
 # Debug settings
 SHOW_FULL_TEXT = True  # Show full extracted text in output (for debugging)
                        # True = Show all extracted OCR text (useful for debugging language detection issues)
@@ -79,6 +106,7 @@ python test_readability.py C:\\Users\\YourName\\Documents\\Scans -r -o report.ht
 import os
 import sys
 import argparse
+import multiprocessing
 import pytesseract
 import textwrap
 from PIL import Image
@@ -90,7 +118,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from checks.confidence_check import calculate_ocr_confidence
 from checks.clarity_check import calculate_ink_ratio
-from utils.document_processor import extract_page_data
+from utils.document_processor import iter_page_data
+from utils.readability_runner import (init_worker, load_cached_pages, ocr_cache_path, prefetch_files,
+                                      run_captured, store_cached_pages, summarize_results)
 
 # Default thresholds (updated based on dataset analysis)
 DEFAULT_READABILITY_THRESHOLD = 15  # OCR confidence threshold (lowered from 40)
@@ -150,21 +180,29 @@ def get_files_in_folder(folder_path, extensions=None, recursive=False):
     if extensions is None:
         extensions = SUPPORTED_EXTENSIONS
 
-    files = set()  # Use set to automatically deduplicate
-    folder = Path(folder_path)
-
-    for ext in extensions:
-        if recursive:
-            # Search recursively in subfolders (case-insensitive)
-            files.update(folder.rglob(f'*{ext}'))
-        else:
-            # Search only in top-level folder (case-insensitive)
-            files.update(folder.glob(f'*{ext}'))
-
+    extensions = {ext.lower() for ext in extensions}
+    files = []
+
+    # One directory walk for all extensions; DirEntry caches the file type,
+    # so matching (case-insensitive) needs no extra stat() calls
+    def _scan(directory):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        try:
+                            _scan(entry.path)
+                        except OSError:
+                            # Unreadable subfolder: skip it, as Path.rglob does
+                            pass
+                elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                    files.append(Path(entry.path))
+
+    _scan(folder_path)
     return sorted(files)
 
 
-def process_file(file_path, readability_threshold=DEFAULT_READABILITY_THRESHOLD, emptiness_threshold=DEFAULT_EMPTINESS_THRESHOLD, verbose=False, primary_language='ita', auto_detect=True):
+def process_file(file_path, readability_threshold=DEFAULT_READABILITY_THRESHOLD, emptiness_threshold=DEFAULT_EMPTINESS_THRESHOLD, verbose=False, primary_language='ita', auto_detect=True, file_bytes=None, cache_dir=None, ocr_max_dim=DEFAULT_OCR_MAX_DIM, skip_ocr_on_empty=DEFAULT_SKIP_OCR_ON_EMPTY):
     """
     Process a single file and return readability metrics.
 
@@ -175,6 +213,10 @@ def process_file(file_path, readability_threshold=DEFAULT_READABILITY_THRESHOLD,
         verbose: If True, print detailed progress
         primary_language: Primary OCR language (default: 'ita' for Italian)
         auto_detect: If True, auto-detect language from content (default: True)
+        file_bytes: File contents if already read (default: read from file_path)
+        cache_dir: OCR cache folder; None disables the cache (default: None)
+        ocr_max_dim: Downscale pages to this longest side before OCR (default: full resolution)
+        skip_ocr_on_empty: If True, pages below the emptiness threshold are not OCR'd (default: False)
 
     Returns:
         list: List of dicts with page metrics
@@ -195,31 +237,54 @@ def process_file(file_path, readability_threshold=DEFAULT_READABILITY_THRESHOLD,
             else:
                 print(f"  [FILE] {file_name}...", end=" ", flush=True)
 
-        # Read file
-        with open(file_path, 'rb') as f:
-            file_bytes = f.read()
-
-        # Extract pages with language configuration
-        page_data, _ = extract_page_data(file_bytes, file_name, primary_language=primary_language, auto_detect=auto_detect)
+        # Read file (unless it was prefetched)
+        if file_bytes is None:
+            with open(file_path, 'rb') as f:
+                file_bytes = f.read()
+
+        # Blank pages (by ink ratio) are already known to be empty; don't spend a Tesseract pass on them
+        # Note: emptiness_threshold is a percentage, ink ratios are 0.0 to 1.0
+        min_ocr_ink_ratio = emptiness_threshold / 100 if skip_ocr_on_empty else None
+
+        # Reuse OCR results from a previous run if this exact file was seen before
+        cache_path = (ocr_cache_path(cache_dir, file_bytes, primary_language, auto_detect, OCR_MODE,
+                                     ocr_max_dim, min_ocr_ink_ratio)
+                      if cache_dir else None)
+        page_data = load_cached_pages(cache_path) if cache_path else None
+        cached = page_data is not None
+
+        if not cached:
+            # Extract pages with language configuration, one page at a time. Only the
+            # metrics are needed here, so each rendered page is freed as soon as it
+            # has been measured instead of holding every page image for the whole file
+            page_data = []
+            for page_info in iter_page_data(file_bytes, file_name, primary_language=primary_language, auto_detect=auto_detect,
+                                            min_ocr_ink_ratio=min_ocr_ink_ratio, ocr_max_dim=ocr_max_dim):
+                img = page_info.pop('image', None)
+                if img is not None:
+                    img.close()
+                page_data.append(page_info)
+            if cache_path:
+                store_cached_pages(cache_path, page_data)
 
         if verbose:
-            print(f"     Found {len(page_data)} page(s)")
+            print(f"     Found {len(page_data)} page(s){' (cached)' if cached else ''}")
 
         for page_info in page_data:
             page_num = page_info['page']
 
-            # Use pre-calculated metrics from extract_page_data (avoids double analysis)
+            # Use pre-calculated metrics from iter_page_data (avoids double analysis)
             ocr_conf = page_info.get('ocr_conf', 0.0)
             ink_ratio = page_info.get('ink_ratio', 0.0)
 
-            # Determine if readable (same logic as app.py)
-            is_readable = ocr_conf >= readability_threshold
-
             # Determine if empty (same logic as app.py: ink_ratio_pct < emptiness_threshold)
             # Note: emptiness_threshold is already in percentage (e.g., 0.5 means 0.5%)
             ink_ratio_pct = ink_ratio * 100
             is_empty = ink_ratio_pct < emptiness_threshold
 
+            # Determine if readable (same logic as app.py); blank pages weren't OCR'd when skipping
+            is_readable = ocr_conf >= readability_threshold and not (skip_ocr_on_empty and is_empty)
+
             results.append({
                 'file': file_name,
                 'folder': parent_folder if parent_folder else '(root)',
@@ -273,18 +338,8 @@ def process_file(file_path, readability_threshold=DEFAULT_READABILITY_THRESHOLD,
     return results
 
 
-def write_html_output(output_path, folder_path, all_results, duration, readability_threshold, emptiness_threshold):
-    """
-    Write results to an HTML file with detailed page-wise reporting and document viewer.
-
-    Args:
-        output_path: Path to output HTML file
-        folder_path: Scanned folder path
-        all_results: List of result dictionaries
-        duration: Processing time in seconds
-        readability_threshold: Readability threshold used
-        emptiness_threshold: Emptiness threshold used
-    """
+def _iter_html_chunks(output_path, folder_path, all_results, duration, readability_threshold, emptiness_threshold):
+    """Yield the HTML report piece by piece (see write_html_output)."""
     # Group results by folder, then by file
     folders = {}
     for result in all_results:
@@ -297,10 +352,7 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
         folders[folder][file_name].append(result)
 
     # Calculate statistics
-    readable_count = sum(1 for r in all_results if r['readable'])
-    unreadable_count = len(all_results) - readable_count
-    empty_count = sum(1 for r in all_results if r['empty'])
-    avg_confidence = sum(r['confidence'] for r in all_results) / len(all_results) if all_results else 0
+    readable_count, unreadable_count, empty_count, avg_confidence = summarize_results(all_results)
 
     # Count unique files
     unique_files = len(set((r['folder'], r['file']) for r in all_results))
@@ -309,8 +361,8 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
     output_dir = os.path.dirname(os.path.abspath(output_path))
     folder_abs_path = os.path.abspath(folder_path)
 
-    # Start building HTML content
-    html_content = f"""<!DOCTYPE html>
+    # Stream HTML content
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -614,16 +666,13 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
 """
 
     for folder_name, files in sorted(folders.items()):
-        html_content += f"""    <div class="folder-section">
+        yield f"""    <div class="folder-section">
         <div class="folder-title">Folder: {folder_name}</div>
 """
         for file_name, file_results in sorted(files.items()):
             # Calculate per-file statistics
-            file_readable = sum(1 for r in file_results if r['readable'])
-            file_unreadable = len(file_results) - file_readable
-            file_empty = sum(1 for r in file_results if r['empty'])
+            file_readable, file_unreadable, file_empty, file_avg_conf = summarize_results(file_results)
             file_total = len(file_results)
-            file_avg_conf = sum(r['confidence'] for r in file_results) / len(file_results) if file_results else 0
 
             # Build actual file path including subfolder
             if folder_name and folder_name != '(root)':
@@ -644,7 +693,7 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
             file_name_escaped = file_name.replace("'", "\\'")
             folder_name_escaped = folder_name.replace("'", "\\'")
 
-            html_content += f"""        <div class="file-section">
+            yield f"""        <div class="file-section">
             <div class="file-header">
                 <div class="file-name">File: {file_name}</div>
                 <div style="display: flex; align-items: center; gap: 15px;">
@@ -691,7 +740,7 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
                     conf_class = 'confidence-low'
 
                 if 'error' in result:
-                    html_content += f"""                    <tr>
+                    yield f"""                    <tr>
                         <td colspan="8" class="error">Error: Page {page}: {result['error']}</td>
                     </tr>
 """
@@ -709,7 +758,7 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
                     text_class = 'text-preview-full' if SHOW_FULL_TEXT else 'text-preview'
                     text_label = '<div class="text-label">EXTRACTED TEXT (FULL):</div>' if SHOW_FULL_TEXT else ''
 
-                    html_content += f"""                    <tr>
+                    yield f"""                    <tr>
                         <td><strong>#{page}</strong></td>
                         <td>
                             <a href="{doc_path}#page={page}" target="_blank" class="view-btn" style="padding: 4px 10px; font-size: 11px;" title="View page {page} of {file_name}">
@@ -730,15 +779,15 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
                     </tr>
 """
 
-            html_content += """                </tbody>
+            yield """                </tbody>
             </table>
         </div>
 """
 
-        html_content += """    </div>
+        yield """    </div>
 """
 
-    html_content += f"""
+    yield f"""
     <div class="footer">
         <div><strong>Report Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
         <div style="margin-top: 8px;"><strong>Thresholds Used:</strong> Readability &ge; {readability_threshold}% | Emptiness &lt; {emptiness_threshold}%</div>
@@ -748,8 +797,23 @@ def write_html_output(output_path, folder_path, all_results, duration, readabili
 </html>
 """
 
+
+def write_html_output(output_path, folder_path, all_results, duration, readability_threshold, emptiness_threshold):
+    """
+    Write results to an HTML file with detailed page-wise reporting and document viewer.
+
+    Args:
+        output_path: Path to output HTML file
+        folder_path: Scanned folder path
+        all_results: List of result dictionaries
+        duration: Processing time in seconds
+        readability_threshold: Readability threshold used
+        emptiness_threshold: Emptiness threshold used
+    """
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        for chunk in _iter_html_chunks(output_path, folder_path, all_results, duration,
+                                       readability_threshold, emptiness_threshold):
+            f.write(chunk)
 
 
 def write_txt_output(output_path, folder_path, all_results, duration, readability_threshold, emptiness_threshold, files_count):
@@ -791,10 +855,7 @@ def write_txt_output(output_path, folder_path, all_results, duration, readabilit
         f.write("\n" + "-" * 100 + "\n\n")
 
         # Summary statistics
-        readable_count = sum(1 for r in all_results if r['readable'])
-        unreadable_count = len(all_results) - readable_count
-        empty_count = sum(1 for r in all_results if r['empty'])
-        avg_confidence = sum(r['confidence'] for r in all_results) / len(all_results) if all_results else 0
+        readable_count, unreadable_count, empty_count, avg_confidence = summarize_results(all_results)
 
         f.write("SUMMARY\n")
         f.write("-" * 60 + "\n")
@@ -816,11 +877,8 @@ def write_txt_output(output_path, folder_path, all_results, duration, readabilit
 
             for file_name, file_results in sorted(files.items()):
                 # Calculate per-file statistics
-                file_readable = sum(1 for r in file_results if r['readable'])
-                file_unreadable = len(file_results) - file_readable
-                file_empty = sum(1 for r in file_results if r['empty'])
+                file_readable, file_unreadable, file_empty, file_avg_conf = summarize_results(file_results)
                 file_total = len(file_results)
-                file_avg_conf = sum(r['confidence'] for r in file_results) / len(file_results) if file_results else 0
 
                 f.write(f"\n  📄 FILE: {file_name}\n")
                 f.write(f"     {'─' * 70}\n")
@@ -884,7 +942,7 @@ def write_txt_output(output_path, folder_path, all_results, duration, readabilit
         f.write("\nNote: Each document was analyzed page-by-page. OCR confidence and ink ratio were calculated once per page.\n")
 
 
-def run_readability_check(folder_path, output_file=None, readability_threshold=DEFAULT_READABILITY_THRESHOLD, emptiness_threshold=DEFAULT_EMPTINESS_THRESHOLD, recursive=False, verbose=False, auto_open=False, primary_language='ita', auto_detect=True):
+def run_readability_check(folder_path, output_file=None, readability_threshold=DEFAULT_READABILITY_THRESHOLD, emptiness_threshold=DEFAULT_EMPTINESS_THRESHOLD, recursive=False, verbose=False, auto_open=False, primary_language='ita', auto_detect=True, jobs=DEFAULT_JOBS, cache_dir=DEFAULT_CACHE_DIR, ocr_max_dim=DEFAULT_OCR_MAX_DIM, skip_ocr_on_empty=DEFAULT_SKIP_OCR_ON_EMPTY):
     """
     Run readability checks on all files in a folder.
 
@@ -898,6 +956,10 @@ def run_readability_check(folder_path, output_file=None, readability_threshold=D
         auto_open: If True, automatically open HTML output in browser
         primary_language: Primary OCR language (default: 'ita' for Italian)
         auto_detect: If True, auto-detect language from content (default: True)
+        jobs: Number of files to process in parallel (default: one per 4 CPU cores)
+        cache_dir: OCR cache folder; None disables the cache (default: None)
+        ocr_max_dim: Downscale pages to this longest side before OCR (default: full resolution)
+        skip_ocr_on_empty: If True, pages below the emptiness threshold are not OCR'd (default: False)
 
     Returns:
         tuple: (all_results, output_path)
@@ -930,7 +992,10 @@ def run_readability_check(folder_path, output_file=None, readability_threshold=D
     print(f"Recursive: {'Yes (include subfolders)' if recursive else 'No (top-level only)'}")
     print(f"Output File: {output_file if output_file else 'report/ (auto-generated with ID and timestamp)'}")
     print(f"Primary Language: {primary_language.upper()}")
-    print(f"Auto-Detect: {'Yes' if auto_detect else 'No (use primary only)'}\n")
+    print(f"Auto-Detect: {'Yes' if auto_detect else 'No (use primary only)'}")
+    print(f"Skip OCR on Empty Pages: {'Yes' if skip_ocr_on_empty else 'No'}")
+    print(f"OCR Resolution: {f'max {ocr_max_dim}px' if ocr_max_dim else 'Full'}")
+    print(f"OCR Cache: {os.path.expanduser(cache_dir) if cache_dir else 'Disabled'}\n")
 
     # Get files
     files = get_files_in_folder(folder_path, recursive=recursive)
@@ -948,13 +1013,32 @@ def run_readability_check(folder_path, output_file=None, readability_threshold=D
     all_results = []
     start_time = datetime.now()
 
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 1) // 4)
+    jobs = min(jobs, len(files))
+
     print("Processing files...")
     print("-" * 60)
-    for idx, file_path in enumerate(files, 1):
-        if not verbose:
-            print(f"[{idx}/{len(files)}]", end=" ")
-        results = process_file(file_path, readability_threshold, emptiness_threshold, verbose, primary_language, auto_detect)
-        all_results.extend(results)
+    if jobs > 1:
+        # Files are independent; OCR them in worker processes, report in order
+        tasks = [(process_file, (file_path, readability_threshold, emptiness_threshold, verbose, primary_language,
+                                 auto_detect, None, cache_dir, ocr_max_dim, skip_ocr_on_empty))
+                 for file_path in files]
+        with multiprocessing.Pool(jobs, initializer=init_worker,
+                                  initargs=(pytesseract.pytesseract.tesseract_cmd,)) as pool:
+            for idx, (results, output) in enumerate(pool.imap(run_captured, tasks, chunksize=1), 1):
+                if not verbose:
+                    print(f"[{idx}/{len(files)}]", end=" ")
+                print(output, end="")
+                all_results.extend(results)
+    else:
+        for idx, (file_path, file_bytes) in enumerate(prefetch_files(files), 1):
+            if not verbose:
+                print(f"[{idx}/{len(files)}]", end=" ")
+            results = process_file(file_path, readability_threshold, emptiness_threshold, verbose, primary_language, auto_detect,
+                                   file_bytes=file_bytes, cache_dir=cache_dir, ocr_max_dim=ocr_max_dim,
+                                   skip_ocr_on_empty=skip_ocr_on_empty)
+            all_results.extend(results)
 
     print("-" * 60)
     end_time = datetime.now()
@@ -1005,10 +1089,7 @@ def run_readability_check(folder_path, output_file=None, readability_threshold=D
 
     # Print summary to console
     # Calculate statistics for console output
-    readable_count = sum(1 for r in all_results if r['readable'])
-    unreadable_count = len(all_results) - readable_count
-    empty_count = sum(1 for r in all_results if r['empty'])
-    avg_confidence = sum(r['confidence'] for r in all_results) / len(all_results) if all_results else 0
+    readable_count, unreadable_count, empty_count, avg_confidence = summarize_results(all_results)
     unique_files = len(set(r['file'] for r in all_results))
 
     print(f"\n{'='*60}")
@@ -1132,6 +1213,38 @@ Language Options:
         help='Show full extracted text in output (for debugging). Overrides SHOW_FULL_TEXT config'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        help='Number of files to process in parallel (default: one per 4 CPU cores; 1 = sequential)'
+    )
+
+    parser.add_argument(
+        '--skip-ocr-on-empty',
+        action=argparse.BooleanOptionalAction,
+        default=DEFAULT_SKIP_OCR_ON_EMPTY,
+        help='Do not OCR pages whose ink ratio is below the emptiness threshold (default: off). '
+             'Faster, but changes results: such pages get confidence 0 and are never readable, '
+             'which lowers per-file and overall average confidence'
+    )
+
+    parser.add_argument(
+        '--ocr-max-dim',
+        type=int,
+        default=DEFAULT_OCR_MAX_DIM,
+        help='Downscale pages so the longest side is at most this many pixels before OCR (default: full resolution)'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        metavar='PATH',
+        default=DEFAULT_CACHE_DIR,
+        help='Cache per-page OCR results in PATH so unchanged files are not OCR\'d again (default: no cache). '
+             'Each entry is a plaintext JSON file with the full extracted text of the document; '
+             'entries are never deleted automatically'
+    )
+
     args = parser.parse_args()
 
     # Override SHOW_FULL_TEXT if --full-text flag is provided
@@ -1148,6 +1261,14 @@ Language Options:
         print("[ERROR] Emptiness threshold must be between 0 and 10.")
         sys.exit(1)
 
+    if args.jobs is not None and args.jobs < 1:
+        print("[ERROR] Number of jobs must be at least 1.")
+        sys.exit(1)
+
+    if args.ocr_max_dim is not None and args.ocr_max_dim < 1:
+        print("[ERROR] OCR max dimension must be at least 1 pixel.")
+        sys.exit(1)
+
     # Run the check
     run_readability_check(
         folder_path=args.folder,
@@ -1158,7 +1279,11 @@ Language Options:
         verbose=args.verbose,
         auto_open=args.open,
         primary_language=args.language,
-        auto_detect=args.auto_detect
+        auto_detect=args.auto_detect,
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        ocr_max_dim=args.ocr_max_dim,
+        skip_ocr_on_empty=args.skip_ocr_on_empty
     )
 
 
@@ -7,8 +7,32 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from utils.document_processor import extract_page_data
 
+# File types analyzed, in reporting order
+SUPPORTED_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg')
+
+
+def _extract_file(file_path):
+    """
+    Extract page data for one file (runs in a worker process).
+    
+    Returns:
+        tuple: (page data without images, error message or None). Errors are
+        returned as text since not every OCR exception survives pickling.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            file_bytes = f.read()
+        
+        page_data, _ = extract_page_data(file_bytes, file_path.name)
+    except Exception as e:
+        return None, str(e)
+    
+    # Page images are not needed here; don't ship them back to the parent
+    return [{k: v for k, v in page_info.items() if k != 'image'} for page_info in page_data], None
+
 
 def analyze_dataset():
     """Analyze all documents in dataset"""
@@ -38,17 +62,32 @@ def analyze_dataset():
         print(f"CATEGORY: {folder} ({description})")
         print(f"{'='*90}")
         
-        files = list(folder_path.glob('*.pdf')) + list(folder_path.glob('*.png')) + \
-                list(folder_path.glob('*.jpg')) + list(folder_path.glob('*.jpeg'))
+        # One directory scan; PDFs first, then images (skip hidden files like glob)
+        with os.scandir(folder_path) as entries:
+            files = [Path(entry.path) for entry in entries
+                     if not entry.name.startswith('.') and entry.is_file()
+                     and os.path.splitext(entry.name)[1] in SUPPORTED_EXTENSIONS]
+        files.sort(key=lambda file_path: SUPPORTED_EXTENSIONS.index(file_path.suffix))
+        
+        files = files[:5]  # Limit to 5 files per category
+        if not files:
+            continue
         
         category_scores = []
         
-        for file_path in files[:5]:  # Limit to 5 files per category
-            try:
-                with open(file_path, 'rb') as f:
-                    file_bytes = f.read()
+        # OCR the files in parallel; results are still reported in file order
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(files))) as executor:
+            futures = [executor.submit(_extract_file, file_path) for file_path in files]
+            
+            for file_path, future in zip(files, futures):
+                try:
+                    page_data, error = future.result()
+                except Exception as e:
+                    page_data, error = None, str(e)
                 
-                page_data, _ = extract_page_data(file_bytes, file_path.name)
+                if error is not None:
+                    print(f"  ERROR: {file_path.name} - {error}")
+                    continue
                 
                 for page_info in page_data:
                     conf = page_info['ocr_conf']
@@ -72,9 +111,6 @@ def analyze_dataset():
                     print(f"  {file_path.name[:35]:35s} P{page_info['page']:2d} | "
                           f"Conf: {conf:6.2f}% | Lang: {lang:3s} | "
                           f"Ink: {ink:5.2f}% | Text: {text_len:4d} | {status}")
-                    
-            except Exception as e:
-                print(f"  ERROR: {file_path.name} - {e}")
         
         if category_scores:
             avg = sum(category_scores) / len(category_scores)
@@ -6,10 +6,7 @@ import os
 import sys
 import fitz
 from PIL import Image
-import io
 import pytesseract
-import cv2
-import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -39,8 +36,7 @@ for pdf_path in TEST_FILES:
     page = doc.load_page(0)
     mat = fitz.Matrix(2, 2)
     pix = page.get_pixmap(matrix=mat)
-    img_data = pix.tobytes("png")
-    pil_img = Image.open(io.BytesIO(img_data))
+    pil_img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
     
     # Resize for OCR
     resized_image = resize_image_for_ocr(pil_img)
@@ -6,7 +6,6 @@ import os
 import sys
 import fitz  # PyMuPDF
 from PIL import Image
-import io
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -43,8 +42,7 @@ def test_pdf(pdf_path):
         page = doc.load_page(page_num)
         mat = fitz.Matrix(2, 2)
         pix = page.get_pixmap(matrix=mat)
-        img_data = pix.tobytes("png")
-        pil_img = Image.open(io.BytesIO(img_data))
+        pil_img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
         
         # Test with English
         print("\n[ENGLISH OCR]")
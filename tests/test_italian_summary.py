@@ -1,13 +1,9 @@
 """Simple test to show confidence improvements"""
 import os
 import sys
-import fitz
-from PIL import Image
-import io
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from checks.confidence_check import calculate_ocr_confidence
 from utils.document_processor import extract_page_data
 
 TEST_FILES = [
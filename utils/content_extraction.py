@@ -23,7 +23,7 @@ def resize_image_for_ocr(image, max_size=(400, 400)):
     Returns:
         PIL Image: Resized image
     """
-    img_cv = np.array(image)
+    img_cv = np.asarray(image)
     height, width = img_cv.shape[:2]
     
     # Calculate scaling factor to fit within max_size
@@ -59,12 +59,6 @@ def extract_text_content_superfast(image):
     # Resize image to speed up OCR
     resized_image = resize_image_for_ocr(image)
     
-    # Convert PIL image to OpenCV format
-    img_cv = cv2.cvtColor(np.array(resized_image), cv2.COLOR_RGB2BGR)
-
-    # Convert to grayscale for OCR
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
     # Extract text using Tesseract with fastest PSM mode
     pil_for_ocr = resized_image.convert('RGB')
     text = pytesseract.image_to_string(pil_for_ocr, config='--psm 7')  # Single text line mode
@@ -86,12 +80,6 @@ def extract_text_content_fast(image):
     """
     start_time = time.time()
 
-    # Convert PIL image to OpenCV format
-    img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-    # Convert to grayscale for OCR
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
     # Extract text using Tesseract with a more appropriate PSM for multi-line content
     pil_for_ocr = image.convert('RGB')
     text = pytesseract.image_to_string(pil_for_ocr, config='--psm 6')  # Assume a single uniform block of text
@@ -132,12 +120,6 @@ def extract_text_content_balanced(image):
     """
     start_time = time.time()
     
-    # Convert PIL image to OpenCV format
-    img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-    # Convert to grayscale for OCR
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
     # Extract text using Tesseract with optimized PSM mode
     pil_for_ocr = image.convert('RGB')
     text = pytesseract.image_to_string(pil_for_ocr, config='--psm 6')
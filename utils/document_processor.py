@@ -89,24 +89,68 @@ def detect_document_language(text_content, primary_language='ita'):
     return primary_language
 
 
-def extract_page_data(file_bytes, file_name, primary_language=None, auto_detect=None):
+def _measure_page(pil_img, primary_language, auto_detect, min_ocr_ink_ratio=None, ocr_max_dim=None):
     """
-    Extracts page data from uploaded file (PDF or image) and calculates quality metrics.
+    OCR one page image and calculate its quality metrics.
+
+    Args:
+        pil_img: PIL Image of the page
+        primary_language: Primary OCR language
+        auto_detect: If True, detect the language from the extracted text
+        min_ocr_ink_ratio: If set, pages with a lower ink ratio skip OCR entirely
+            (no text, zero confidence)
+        ocr_max_dim: If set, OCR runs on a copy downscaled so its longest side is at
+            most this many pixels (ink ratio is always measured at full resolution)
+
+    Returns:
+        tuple: (text_content, detected_language, ink_ratio, ocr_conf)
+    """
+    # Ink ratio is cheap, so measure it first
+    ink_ratio, _ = calculate_ink_ratio(pil_img)
+
+    if min_ocr_ink_ratio is not None and ink_ratio < min_ocr_ink_ratio:
+        return '', primary_language, ink_ratio, 0.0
+
+    # Tesseract time grows with pixel count, so optionally OCR a smaller copy
+    ocr_img = pil_img
+    if ocr_max_dim and max(pil_img.size) > ocr_max_dim:
+        ocr_img = pil_img.copy()
+        ocr_img.thumbnail((ocr_max_dim, ocr_max_dim), Image.Resampling.LANCZOS)
+
+    # First pass: Extract text to detect language
+    text_content, _ = extract_text_content(ocr_img, mode='fast')
+
+    # Detect document language
+    if auto_detect:
+        doc_lang = detect_document_language(text_content, primary_language)
+    else:
+        doc_lang = primary_language
+
+    # Calculate OCR confidence with detected language
+    ocr_conf, _ = calculate_ocr_confidence(ocr_img, mode='fast', lang=doc_lang)
+
+    return text_content, doc_lang, ink_ratio, ocr_conf
+
+
+def iter_page_data(file_bytes, file_name, primary_language=None, auto_detect=None, min_ocr_ink_ratio=None,
+                   ocr_max_dim=None):
+    """
+    Extracts page data one page at a time, so callers that don't keep the page
+    images only hold one rendered page in memory.
 
     Args:
         file_bytes: Bytes of the uploaded file
         file_name: Name of the uploaded file
         primary_language: Primary OCR language (default from config: 'ita')
         auto_detect: If True, auto-detect language from content (default from config: True)
+        min_ocr_ink_ratio: If set, pages whose ink ratio (0.0 to 1.0) is below it are
+            treated as blank and not OCR'd (default None: OCR every page)
+        ocr_max_dim: If set, pages are downscaled to at most this many pixels on their
+            longest side for OCR (default None: OCR at full resolution)
 
-    Returns:
-        List of dictionaries containing page data with quality metrics
+    Yields:
+        Dictionary of page data with quality metrics, in page order
     """
-    results = []
-
-    # Record extraction timing
-    start_time = time.time()
-
     # Load OCR settings from config
     ocr_settings = load_ocr_settings()
     
@@ -124,14 +168,14 @@ def extract_page_data(file_bytes, file_name, primary_language=None, auto_detect=
         # Check if the PDF has any pages
         if len(doc) == 0:
             # Handle empty PDF - create a default result with zero ink ratio and zero confidence
-            results.append({
+            yield {
                 'page': 1,
                 'ink_ratio': 0.0,  # No content means zero ink ratio
                 'ocr_conf': 0.0,   # No content means zero OCR confidence
                 'image': None,      # No image for empty page
                 'text_content': '',  # No text for empty page
                 'extraction_time': 0.0  # No extraction time for empty PDF
-            })
+            }
         else:
             # Process each page
             for page_num in range(len(doc)):
@@ -143,26 +187,16 @@ def extract_page_data(file_bytes, file_name, primary_language=None, auto_detect=
                 mat = fitz.Matrix(2, 2)
                 pix = page.get_pixmap(matrix=mat)
 
-                # Convert pixmap to image
-                img_data = pix.tobytes("png")
-                pil_img = Image.open(io.BytesIO(img_data))
-
-                # First pass: Extract text to detect language
-                text_content, _ = extract_text_content(pil_img, mode='fast')
+                # Wrap the raw RGB samples directly (no PNG encode/decode round-trip)
+                pil_img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
 
-                # Detect document language
-                if auto_detect:
-                    doc_lang = detect_document_language(text_content, primary_language)
-                else:
-                    doc_lang = primary_language
+                text_content, doc_lang, ink_ratio, ocr_conf = _measure_page(
+                    pil_img, primary_language, auto_detect, min_ocr_ink_ratio, ocr_max_dim
+                )
 
-                # Calculate quality metrics with detected language
-                ink_ratio, _ = calculate_ink_ratio(pil_img)
-                ocr_conf, _ = calculate_ocr_confidence(pil_img, mode='fast', lang=doc_lang)
-
-                # Store results for this page
+                # Yield results for this page
                 page_extraction_time = time.time() - page_start_time
-                results.append({
+                yield {
                     'page': page_num + 1,
                     'ink_ratio': ink_ratio,
                     'ocr_conf': ocr_conf,
@@ -170,28 +204,19 @@ def extract_page_data(file_bytes, file_name, primary_language=None, auto_detect=
                     'text_content': text_content,
                     'detected_language': doc_lang,
                     'extraction_time': page_extraction_time
-                })
+                }
     else:
         # Handle image files (png, jpg, jpeg)
         image_start_time = time.time()
         pil_img = Image.open(io.BytesIO(file_bytes))
 
-        # First pass: Extract text to detect language
-        text_content, _ = extract_text_content(pil_img, mode='fast')
-
-        # Detect document language
-        if auto_detect:
-            doc_lang = detect_document_language(text_content, primary_language)
-        else:
-            doc_lang = primary_language
-
-        # Calculate quality metrics with detected language
-        ink_ratio, _ = calculate_ink_ratio(pil_img)
-        ocr_conf, _ = calculate_ocr_confidence(pil_img, mode='fast', lang=doc_lang)
+        text_content, doc_lang, ink_ratio, ocr_conf = _measure_page(
+            pil_img, primary_language, auto_detect, min_ocr_ink_ratio, ocr_max_dim
+        )
 
-        # Store results for this image
+        # Yield results for this image
         image_extraction_time = time.time() - image_start_time
-        results.append({
+        yield {
             'page': 1,
             'ink_ratio': ink_ratio,
             'ocr_conf': ocr_conf,
@@ -199,9 +224,34 @@ def extract_page_data(file_bytes, file_name, primary_language=None, auto_detect=
             'text_content': text_content,
             'detected_language': doc_lang,
             'extraction_time': image_extraction_time
-        })
+        }
+
+
+def extract_page_data(file_bytes, file_name, primary_language=None, auto_detect=None, min_ocr_ink_ratio=None,
+                      ocr_max_dim=None):
+    """
+    Extracts page data from uploaded file (PDF or image) and calculates quality metrics.
+
+    Args:
+        file_bytes: Bytes of the uploaded file
+        file_name: Name of the uploaded file
+        primary_language: Primary OCR language (default from config: 'ita')
+        auto_detect: If True, auto-detect language from content (default from config: True)
+        min_ocr_ink_ratio: If set, pages whose ink ratio (0.0 to 1.0) is below it are
+            treated as blank and not OCR'd (default None: OCR every page)
+        ocr_max_dim: If set, pages are downscaled to at most this many pixels on their
+            longest side for OCR (default None: OCR at full resolution)
+
+    Returns:
+        List of dictionaries containing page data with quality metrics
+    """
+    # Record extraction timing
+    start_time = time.time()
+
+    results = list(iter_page_data(file_bytes, file_name, primary_language, auto_detect,
+                                  min_ocr_ink_ratio, ocr_max_dim))
 
     total_extraction_time = time.time() - start_time
     
     # Return results with timing info
-    return results, total_extraction_time
\ No newline at end of file
+    return results, total_extraction_time
@@ -0,0 +1,147 @@
+"""
+Module for running readability checks over many files.
+
+Shared helpers for the readability CLI: reading files ahead of OCR, running
+files in worker processes, caching per-page OCR results and summarizing
+page results for reports.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytesseract
+
+# Page fields kept in the OCR cache (everything iter_page_data measures except the image)
+CACHED_PAGE_FIELDS = ('page', 'ocr_conf', 'ink_ratio', 'detected_language', 'text_content')
+
+
+def read_file(file_path):
+    """Read a file's bytes, or None if it can't be read (the caller reports the error)."""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def prefetch_files(files):
+    """
+    Yield (file_path, file_bytes) pairs, reading the next file in a background
+    thread while the current one is being OCR'd.
+
+    Args:
+        files: List of file paths
+
+    Yields:
+        tuple: (file_path, file_bytes), file_bytes is None if the file can't be read
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_read = executor.submit(read_file, files[0]) if files else None
+        for idx, file_path in enumerate(files):
+            file_bytes = next_read.result()
+            if idx + 1 < len(files):
+                next_read = executor.submit(read_file, files[idx + 1])
+            yield file_path, file_bytes
+
+
+def init_worker(tesseract_cmd):
+    """Set up a worker process: same Tesseract binary, one OCR thread per worker."""
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+
+def run_captured(task):
+    """
+    Run a (func, args) task in a worker process with stdout captured.
+
+    Console output is returned with the result, so the parent can print each
+    file's progress in order instead of interleaving workers.
+
+    Args:
+        task: Tuple of (func, args); func must be picklable (module-level)
+
+    Returns:
+        tuple: (func(*args), captured stdout)
+    """
+    func, args = task
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(*args)
+    return result, output.getvalue()
+
+
+def ocr_cache_path(cache_dir, file_bytes, primary_language, auto_detect, ocr_mode,
+                   ocr_max_dim=None, min_ocr_ink_ratio=None):
+    """
+    Path of the cache entry for a file's OCR results.
+
+    The key hashes the file contents together with the OCR language, mode and
+    resolution settings, since those change the extracted text and confidence.
+    Thresholds are applied to the cached metrics on every run, so they are not
+    part of the key - except the ink ratio below which OCR was skipped, which
+    decides which pages have OCR results at all.
+
+    Args:
+        cache_dir: Cache folder
+        file_bytes: File contents
+        primary_language: Primary OCR language
+        auto_detect: Whether the language is auto-detected
+        ocr_mode: OCR speed mode
+        ocr_max_dim: Longest side pages are downscaled to before OCR, if any
+        min_ocr_ink_ratio: Ink ratio below which pages are not OCR'd, if any
+
+    Returns:
+        Path: Cache file path
+    """
+    settings = f"{primary_language}|{auto_detect}|{ocr_mode}|{ocr_max_dim}|{min_ocr_ink_ratio}\0"
+    key = hashlib.blake2b(settings.encode('utf-8'), digest_size=16)
+    key.update(file_bytes)
+    return Path(os.path.expanduser(cache_dir)) / f"{key.hexdigest()}.json"
+
+
+def load_cached_pages(cache_path):
+    """Load cached page metrics, or None if there is no usable cache entry."""
+    try:
+        return json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_pages(cache_path, page_data):
+    """Write page metrics to the cache (best effort: a failed write only costs a re-OCR)."""
+    pages = [{field: page_info.get(field) for field in CACHED_PAGE_FIELDS if field in page_info}
+             for page_info in page_data]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so parallel workers never see a half-written entry
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(pages), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def summarize_results(results):
+    """
+    Count readable/unreadable/empty pages and average the confidence.
+
+    Args:
+        results: List of result dictionaries
+
+    Returns:
+        tuple: (readable_count, unreadable_count, empty_count, avg_confidence)
+    """
+    count = len(results)
+    readable = np.fromiter((r['readable'] for r in results), dtype=bool, count=count)
+    empty = np.fromiter((r['empty'] for r in results), dtype=bool, count=count)
+    confidence = np.fromiter((r['confidence'] for r in results), dtype=np.float64, count=count)
+
+    readable_count = int(readable.sum())
+    avg_confidence = float(confidence.mean()) if count else 0.0
+    return readable_count, count - readable_count, int(empty.sum()), avg_confidence